@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinics', '0014_merge_20250620_1113'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clinicstatus',
+            index=models.Index(fields=['clinic', '-created_at'], include=('state', 'id'), name='clinicstatus_latest_idx'),
+        ),
+    ]
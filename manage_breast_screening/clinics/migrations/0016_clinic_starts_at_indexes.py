@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinics', '0015_clinicstatus_latest_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='clinic',
+            name='starts_at',
+            field=models.DateTimeField(db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='clinicslot',
+            index=models.Index(fields=['clinic', 'starts_at'], name='clinics_cli_clinic__849133_idx'),
+        ),
+    ]
@@ -1,10 +1,14 @@
 import uuid
-from datetime import date
 from enum import StrEnum
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Count, Q
+from django.utils import timezone
 
 from ..core.models import BaseModel
+from ..core.utils.date_ranges import day_range
 
 
 class Provider(BaseModel):
@@ -47,24 +51,53 @@ class ClinicQuerySet(models.QuerySet):
         """
         Clinics that start today
         """
-        return self.filter(starts_at__date=date.today())
+        start, end = day_range()
+        return self.filter(starts_at__gte=start, starts_at__lt=end)
 
     def upcoming(self):
         """
         Clinics that start tomorrow or later
         """
-        return self.filter(starts_at__date__gt=date.today())
+        _, end = day_range()
+        return self.filter(starts_at__gte=end)
 
     def completed(self):
         """
         Clinics that started in the past
         (note: we may want to also consider the clinic state when splitting things out by date)
         """
-        return self.filter(starts_at__date__lt=date.today())
+        start, _ = day_range()
+        return self.filter(starts_at__lt=start)
 
     def with_statuses(self):
         return self.prefetch_related("statuses")
 
+    def with_slot_counts(self):
+        return self.annotate(number_of_slots=Count("clinic_slots"))
+
+    def for_listing(self):
+        """
+        Fetch everything needed to present a list of clinics up front, so
+        that the number of queries does not grow with the number of clinics.
+        """
+        return self.select_related("setting").with_statuses().with_slot_counts()
+
+    def filter_counts(self):
+        """
+        Count the clinics matching each filter, using a single query.
+        """
+        start, end = day_range()
+        return self.aggregate(
+            **{
+                ClinicFilter.ALL: Count("pk"),
+                ClinicFilter.TODAY: Count(
+                    "pk", filter=Q(starts_at__gte=start, starts_at__lt=end)
+                ),
+                ClinicFilter.UPCOMING: Count("pk", filter=Q(starts_at__gte=end)),
+                ClinicFilter.COMPLETED: Count("pk", filter=Q(starts_at__lt=start)),
+            }
+        )
+
 
 class Clinic(BaseModel):
     class RiskType:
@@ -90,7 +123,7 @@ class Clinic(BaseModel):
     TYPE_CHOICES = {Type.ASSESSMENT: "Assessment", Type.SCREENING: "Screening"}
 
     setting = models.ForeignKey(Setting, on_delete=models.PROTECT)
-    starts_at = models.DateTimeField()
+    starts_at = models.DateTimeField(db_index=True)
     ends_at = models.DateTimeField()
     type = models.CharField(choices=TYPE_CHOICES, max_length=50)
     risk_type = models.CharField(choices=RISK_TYPE_CHOICES, max_length=50)
@@ -99,7 +132,9 @@ class Clinic(BaseModel):
 
     @property
     def current_status(self):
-        return self.statuses.order_by("-created_at").first()
+        # statuses are ordered newest first by default; avoid `order_by()` here
+        # so that `statuses` can be prefetched when fetching many clinics
+        return self.statuses.first()
 
     def session_type(self):
         start_hour = self.starts_at.hour
@@ -117,12 +152,22 @@ class Clinic(BaseModel):
 
     @classmethod
     def filter_counts(cls):
-        return {
-            ClinicFilter.ALL: cls.objects.count(),
-            ClinicFilter.TODAY: cls.objects.today().count(),
-            ClinicFilter.UPCOMING: cls.objects.upcoming().count(),
-            ClinicFilter.COMPLETED: cls.objects.completed().count(),
-        }
+        """
+        Count all clinics by filter.
+
+        If CLINIC_FILTER_COUNTS_CACHE_TIMEOUT is set, the counts are cached for that
+        many seconds. The cache key includes today's date, so the buckets roll over
+        at midnight even if the cache has not expired.
+        """
+        timeout = settings.CLINIC_FILTER_COUNTS_CACHE_TIMEOUT
+        if not timeout:
+            return cls.objects.filter_counts()
+
+        return cache.get_or_set(
+            f"clinics:filter_counts:{timezone.localdate().isoformat()}",
+            cls.objects.filter_counts,
+            timeout,
+        )
 
 
 class ClinicSlot(BaseModel):
@@ -132,6 +177,9 @@ class ClinicSlot(BaseModel):
     starts_at = models.DateTimeField()
     duration_in_minutes = models.IntegerField()
 
+    class Meta:
+        indexes = [models.Index(fields=["clinic", "starts_at"])]
+
 
 class ClinicStatus(models.Model):
     SCHEDULED = "SCHEDULED"
@@ -148,6 +196,14 @@ class ClinicStatus(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Covers finding the latest status of a clinic without a sort
+            models.Index(
+                fields=["clinic", "-created_at"],
+                include=["state", "id"],
+                name="clinicstatus_latest_idx",
+            ),
+        ]
 
     id = models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1,9 +1,8 @@
 from functools import cached_property
 
-from django.urls import reverse
-
 from ..core.utils.date_formatting import format_date, format_time_range
 from ..core.utils.string_formatting import sentence_case
+from ..core.utils.urls import cached_reverse
 from ..mammograms.presenters import AppointmentPresenter
 from .models import ClinicStatus
 
@@ -27,6 +26,10 @@ class ClinicsPresenter:
 
 
 class ClinicPresenter:
+    """
+    Present a clinic fetched via `ClinicQuerySet.for_listing`
+    """
+
     STATUS_COLORS = {
         ClinicStatus.SCHEDULED: "blue",  # default blue
         ClinicStatus.IN_PROGRESS: "blue",
@@ -38,7 +41,7 @@ class ClinicPresenter:
         self.id = clinic.id
         self.starts_at = format_date(clinic.starts_at)
         self.session_type = clinic.session_type().capitalize()
-        self.number_of_slots = clinic.clinic_slots.count()
+        self.number_of_slots = clinic.number_of_slots
         self.location_name = sentence_case(clinic.setting.name)
         self.time_range = format_time_range(clinic.time_range())
         self.type = clinic.get_type_display()
@@ -69,6 +72,31 @@ class AppointmentListPresenter:
         self.counts_by_filter = counts_by_filter
         self.clinic_id = clinic_id
 
+    @cached_property
+    def rows(self):
+        """
+        Everything the appointments table needs for each row, so that the
+        template only has to output it.
+        """
+        return [
+            {
+                "appointment": appointment,
+                "start_time": appointment.start_time,
+                "full_name": appointment.participant.full_name,
+                "nhs_number": appointment.participant.nhs_number,
+                "date_of_birth": appointment.participant.date_of_birth,
+                "age": appointment.participant.age,
+                "start_screening_url": cached_reverse(
+                    "mammograms:start_screening", kwargs={"id": appointment.id}
+                ),
+                "check_in_url": cached_reverse(
+                    "clinics:check_in",
+                    kwargs={"id": self.clinic_id, "appointment_id": appointment.id},
+                ),
+            }
+            for appointment in self.appointments
+        ]
+
     @cached_property
     def secondary_nav_data(self):
         filters = [
@@ -98,7 +126,7 @@ class AppointmentListPresenter:
                 {
                     "label": filter_label,
                     "count": count,
-                    "href": reverse(
+                    "href": cached_reverse(
                         "clinics:show_" + filter_identifier,
                         kwargs={"id": self.clinic_id},
                     ),
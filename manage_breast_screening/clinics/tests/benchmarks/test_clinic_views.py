@@ -0,0 +1,75 @@
+from django.urls import reverse
+
+from manage_breast_screening.clinics.models import Clinic, ClinicSlot
+from manage_breast_screening.core.benchmark_setup import BenchmarkTestCase, Budget
+
+
+class TestClinicViewsBenchmark(BenchmarkTestCase):
+    def test_clinic_list(self):
+        for filter in ["today", "upcoming", "completed", "all"]:
+            with self.subTest(filter=filter):
+                self.assertWithinBudget(
+                    f"clinics:index_{filter}",
+                    lambda: self.client.get(reverse(f"clinics:index_{filter}")),
+                    Budget(queries=3, seconds=1.0, peak_memory_kb=8_000),
+                )
+
+    def test_clinic(self):
+        for filter in ["remaining", "checked_in", "complete", "all"]:
+            with self.subTest(filter=filter):
+                self.assertWithinBudget(
+                    f"clinics:show_{filter}",
+                    lambda: self.client.get(
+                        reverse(
+                            f"clinics:show_{filter}",
+                            kwargs={"id": self.busy_clinic.pk},
+                        )
+                    ),
+                    Budget(queries=4, seconds=0.5, peak_memory_kb=2_000),
+                )
+
+
+class TestLargeClinicBenchmark(BenchmarkTestCase):
+    NUMBER_OF_CLINICS = 10
+    SLOTS_IN_BUSY_CLINIC = 200
+
+    def test_clinic_with_200_appointments(self):
+        self.assertWithinBudget(
+            "clinics:show_all (200 appointments)",
+            lambda: self.client.get(
+                reverse("clinics:show_all", kwargs={"id": self.busy_clinic.pk})
+            ),
+            Budget(queries=4, seconds=1.0, peak_memory_kb=6_000),
+        )
+
+
+class TestYearOfClinicsBenchmark(BenchmarkTestCase):
+    NUMBER_OF_SETTINGS = 50
+    NUMBER_OF_CLINICS = 3650
+    SLOTS_PER_CLINIC = 2
+    CLINIC_DAYS = 365
+
+    def test_clinic_list(self):
+        # upcoming and completed each list half a year of clinics
+        for filter, budget in [
+            ("today", Budget(queries=3, seconds=0.25, peak_memory_kb=1_000)),
+            ("upcoming", Budget(queries=3, seconds=3.0, peak_memory_kb=30_000)),
+            ("completed", Budget(queries=3, seconds=3.0, peak_memory_kb=30_000)),
+        ]:
+            with self.subTest(filter=filter):
+                self.assertWithinBudget(
+                    f"clinics:index_{filter} (a year of clinics)",
+                    lambda: self.client.get(reverse(f"clinics:index_{filter}")),
+                    budget,
+                )
+
+    def test_today_uses_index(self):
+        self.assertUsesIndex(
+            Clinic.objects.today(), "clinics_clinic_starts_at_cb3ba6fc"
+        )
+
+    def test_clinic_slots_use_index(self):
+        self.assertUsesIndex(
+            ClinicSlot.objects.filter(clinic=self.busy_clinic).order_by("starts_at"),
+            "clinics_cli_clinic__849133_idx",
+        )
@@ -0,0 +1,10 @@
+from manage_breast_screening.core.benchmark_setup import BenchmarkTestCase
+
+
+class TestClinicQueryPlans(BenchmarkTestCase):
+    def test_current_status(self):
+        self.assertUsesIndex(
+            self.busy_clinic.statuses.all()[:1],
+            "clinicstatus_latest_idx",
+            index_only=True,
+        )
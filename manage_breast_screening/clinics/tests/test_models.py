@@ -3,6 +3,7 @@ from datetime import timezone as tz
 
 import pytest
 import time_machine
+from django.core.cache import cache
 from pytest_django.asserts import assertQuerySetEqual
 
 from manage_breast_screening.clinics import models
@@ -31,3 +32,36 @@ def test_status_filtering():
     assertQuerySetEqual(models.Clinic.objects.today(), {current}, ordered=False)
     assertQuerySetEqual(models.Clinic.objects.upcoming(), {future}, ordered=False)
     assertQuerySetEqual(models.Clinic.objects.completed(), {past}, ordered=False)
+
+
+@pytest.mark.django_db
+@time_machine.travel(datetime(2025, 1, 1, 10, tzinfo=tz.utc))
+def test_filter_counts(django_assert_num_queries):
+    ClinicFactory.create(starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc))
+    ClinicFactory.create(starts_at=datetime(2025, 1, 2, 9, tzinfo=tz.utc))
+    ClinicFactory.create(starts_at=datetime(2025, 1, 3, 9, tzinfo=tz.utc))
+    ClinicFactory.create(starts_at=datetime(2024, 1, 1, 9, tzinfo=tz.utc))
+
+    with django_assert_num_queries(1):
+        counts = models.Clinic.filter_counts()
+
+    assert counts == {
+        models.ClinicFilter.ALL: 4,
+        models.ClinicFilter.TODAY: 1,
+        models.ClinicFilter.UPCOMING: 2,
+        models.ClinicFilter.COMPLETED: 1,
+    }
+
+
+@pytest.mark.django_db
+@time_machine.travel(datetime(2025, 1, 1, 10, tzinfo=tz.utc))
+def test_filter_counts_cached(settings, django_assert_num_queries):
+    settings.CLINIC_FILTER_COUNTS_CACHE_TIMEOUT = 30
+    cache.clear()
+    ClinicFactory.create(starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc))
+
+    assert models.Clinic.filter_counts()[models.ClinicFilter.TODAY] == 1
+
+    ClinicFactory.create(starts_at=datetime(2025, 1, 1, 11, tzinfo=tz.utc))
+    with django_assert_num_queries(0):
+        assert models.Clinic.filter_counts()[models.ClinicFilter.TODAY] == 1
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 from django.urls import reverse
 
+from ...participants.tests.factories import AppointmentFactory
 from ..models import Clinic
 from ..presenters import AppointmentListPresenter, ClinicPresenter
 from .factories import ClinicStatusFactory
@@ -16,7 +17,7 @@ def mock_clinic():
 
     mock.starts_at = datetime(2025, 1, 1, 9)
     mock.session_type.return_value = "All day"
-    mock.clinic_slots.count.return_value = 10
+    mock.number_of_slots = 10
     mock.setting.name = "Test setting"
     mock.time_range.return_value = {
         "start_time": datetime(2025, 1, 1, 9),
@@ -88,3 +89,24 @@ class TestAppointmentListPresenter:
         )
         assert nav_data[3]["href"] == expected_all_url
         assert not nav_data[3]["current"]
+
+    @pytest.mark.django_db
+    def test_rows(self):
+        clinic_id = uuid.uuid4()
+        appointment = AppointmentFactory.build(
+            screening_episode__participant__first_name="Janet",
+            screening_episode__participant__last_name="Williams",
+        )
+
+        presenter = AppointmentListPresenter(clinic_id, [appointment], "all", {})
+        [row] = presenter.rows
+
+        assert row["appointment"].id == appointment.id
+        assert row["full_name"] == "Janet Williams"
+        assert row["start_screening_url"] == reverse(
+            "mammograms:start_screening", kwargs={"id": appointment.id}
+        )
+        assert row["check_in_url"] == reverse(
+            "clinics:check_in",
+            kwargs={"id": clinic_id, "appointment_id": appointment.id},
+        )
@@ -0,0 +1,66 @@
+from datetime import datetime
+from datetime import timezone as tz
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django.asserts import assertTemplateUsed
+
+from .factories import ClinicFactory, ClinicSlotFactory
+
+
+def create_clinic_with_slots(**kwargs):
+    clinic = ClinicFactory.create(**kwargs)
+    ClinicSlotFactory.create_batch(3, clinic=clinic)
+    return clinic
+
+
+@pytest.mark.django_db
+class TestClinicList:
+    def test_renders_template(self, client):
+        create_clinic_with_slots()
+
+        response = client.get(reverse("clinics:index_all"))
+
+        assert response.status_code == 200
+        assertTemplateUsed(response, "clinics/index.jinja")
+
+    def test_number_of_queries_does_not_depend_on_number_of_clinics(self, client):
+        create_clinic_with_slots(starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc))
+        with CaptureQueriesContext(connection) as one_clinic:
+            client.get(reverse("clinics:index_all"))
+
+        for day in range(2, 12):
+            create_clinic_with_slots(starts_at=datetime(2025, 1, day, 9, tzinfo=tz.utc))
+        with CaptureQueriesContext(connection) as many_clinics:
+            response = client.get(reverse("clinics:index_all"))
+
+        assert response.status_code == 200
+        assert len(many_clinics) == len(one_clinic)
+
+
+@pytest.mark.django_db
+class TestClinic:
+    @pytest.fixture
+    def clinic(self):
+        return create_clinic_with_slots()
+
+    def test_renders_template(self, client, clinic):
+        response = client.get(reverse("clinics:show", kwargs={"id": clinic.pk}))
+
+        assert response.status_code == 200
+        assert not response.streaming
+
+    def test_streams_the_page(self, client, clinic, settings):
+        settings.STREAMING_RESPONSES = True
+
+        response = client.get(reverse("clinics:show", kwargs={"id": clinic.pk}))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert "csrftoken" in response.cookies
+
+        chunks = list(response.streaming_content)
+        assert len(chunks) > 1
+        assert b"screening clinic" in b"".join(chunks)
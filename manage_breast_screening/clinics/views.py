@@ -1,13 +1,15 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_http_methods
 
+from ..core.streaming import render_streaming
 from ..participants.models import Appointment, AppointmentStatus
 from .models import Clinic
 from .presenters import AppointmentListPresenter, ClinicPresenter, ClinicsPresenter
 
 
 def clinic_list(request, filter="today"):
-    clinics = Clinic.objects.prefetch_related("setting").by_filter(filter)
+    clinics = Clinic.objects.for_listing().by_filter(filter)
     counts_by_filter = Clinic.filter_counts()
     presenter = ClinicsPresenter(clinics, filter, counts_by_filter)
     return render(
@@ -18,19 +20,19 @@ def clinic_list(request, filter="today"):
 
 
 def clinic(request, id, filter="remaining"):
-    clinic = Clinic.objects.select_related("setting").get(id=id)
+    clinic = Clinic.objects.for_listing().get(id=id)
     presented_clinic = ClinicPresenter(clinic)
     appointments = (
         Appointment.objects.for_clinic_and_filter(clinic, filter)
-        .prefetch_related("statuses")
-        .select_related("clinic_slot__clinic", "screening_episode__participant")
         .order_by("clinic_slot__starts_at")
+        .summaries()
     )
     counts_by_filter = Appointment.objects.filter_counts_for_clinic(clinic)
     presented_appointment_list = AppointmentListPresenter(
         id, appointments, filter, counts_by_filter
     )
-    return render(
+    render_page = render_streaming if settings.STREAMING_RESPONSES else render
+    return render_page(
         request,
         "clinics/show.jinja",
         context={
@@ -1,9 +1,95 @@
+import time
+from pathlib import Path
+
 from django.conf import settings
 from django.templatetags.static import static
-from django.urls import reverse
-from jinja2 import ChoiceLoader, Environment, PackageLoader
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    TemplateNotFound,
+)
 from markupsafe import Markup, escape
 
+from ..core.request_metrics import current_metrics
+from ..core.utils.date_formatting import (
+    format_date,
+    format_date_time,
+    format_relative_date,
+    format_time,
+)
+from ..core.utils.urls import cached_reverse
+from .jinja2_fragment_cache import FragmentCacheExtension
+
+
+class MeasuredTemplate(Template):
+    """
+    A template that adds the time it takes to render to the current request's metrics,
+    whether it is rendered all at once or streamed
+    """
+
+    def render(self, *args, **kwargs):
+        metrics = current_metrics()
+        if metrics is None:
+            return super().render(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            metrics.template_seconds += time.perf_counter() - start
+
+    def generate(self, *args, **kwargs):
+        chunks = super().generate(*args, **kwargs)
+        while True:
+            metrics = current_metrics()
+            start = time.perf_counter()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            finally:
+                if metrics is not None:
+                    metrics.template_seconds += time.perf_counter() - start
+            yield chunk
+
+
+class MemoisedChoiceLoader(ChoiceLoader):
+    """
+    A ChoiceLoader that remembers which of its loaders each template was found in,
+    so that later lookups go straight to that loader rather than probing each
+    loader in turn.
+
+    Templates are assumed not to change, so it also skips checking whether
+    they are up to date. Only use it when templates aren't being edited.
+    """
+
+    def __init__(self, loaders):
+        super().__init__(loaders)
+        self.owners = {}
+
+    def get_source(self, environment, template):
+        owner = self.owners.get(template)
+        if owner is not None:
+            source, filename, _ = owner.get_source(environment, template)
+            return source, filename, _always_uptodate
+
+        for loader in self.loaders:
+            try:
+                source, filename, _ = loader.get_source(environment, template)
+            except TemplateNotFound:
+                continue
+            self.owners[template] = loader
+            return source, filename, _always_uptodate
+
+        raise TemplateNotFound(template)
+
+
+def _always_uptodate():
+    return True
+
 
 def no_wrap(value):
     """
@@ -31,10 +117,31 @@ def raise_helper(msg):
     raise Exception(msg)
 
 
+def bytecode_cache():
+    """
+    Cache compiled templates on disk if JINJA2_BYTECODE_CACHE_DIR is set, so that
+    they can be shared between processes and precompiled with `compile_templates`
+    """
+    if not settings.JINJA2_BYTECODE_CACHE_DIR:
+        return None
+
+    directory = Path(settings.JINJA2_BYTECODE_CACHE_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(directory))
+
+
 def environment(**options):
-    env = Environment(**options, extensions=["jinja2.ext.do"])
+    env = Environment(
+        **options,
+        extensions=["jinja2.ext.do", FragmentCacheExtension],
+        bytecode_cache=bytecode_cache(),
+    )
+    env.template_class = MeasuredTemplate
     if env.loader:
-        env.loader = ChoiceLoader(
+        loader_class = (
+            MemoisedChoiceLoader if settings.JINJA2_MEMOISE_LOADERS else ChoiceLoader
+        )
+        env.loader = loader_class(
             [
                 env.loader,
                 PackageLoader(
@@ -46,9 +153,13 @@ def environment(**options):
         )
 
     env.globals.update(
-        {"static": static, "url": reverse, "STATIC_URL": settings.STATIC_URL}
+        {"static": static, "url": cached_reverse, "STATIC_URL": settings.STATIC_URL}
     )
     env.filters["no_wrap"] = no_wrap
     env.filters["as_hint"] = as_hint
+    env.filters["format_date"] = format_date
+    env.filters["format_date_time"] = format_date_time
+    env.filters["format_relative_date"] = format_relative_date
+    env.filters["format_time"] = format_time
     env.globals["raise"] = raise_helper
     return env
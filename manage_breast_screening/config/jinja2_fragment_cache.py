@@ -0,0 +1,93 @@
+"""
+A `{% cache %}` tag for Jinja templates, which renders a block once per distinct
+key and reuses the HTML after that.
+
+    {% cache presented_clinic.state.text, presented_clinic.state.classes %}
+      {{ tag({"text": presented_clinic.state.text, ...}) }}
+    {% endcache %}
+
+The key must include everything the block depends on, as scalar values such as
+strings and numbers: other objects, such as model instances, don't have a repr
+that identifies their value, so they raise a TypeError.
+
+Blocks are cached in a bounded in-process LRU cache, and also in a Django cache
+if JINJA2_FRAGMENT_CACHE_BACKEND is set. Each block is identified by its source
+as well as its key, so changing a block invalidates it, but changing a macro it
+calls does not: change the Django cache's VERSION or KEY_PREFIX on deploy to
+avoid reusing fragments rendered by an earlier release. Never cache anything
+that is specific to a user or a request, such as a CSRF token.
+"""
+
+from datetime import date, time, timedelta
+from decimal import Decimal
+from hashlib import sha1
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import caches
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.utils import LRUCache
+from markupsafe import Markup
+
+KEY_TYPES = (str, int, float, Decimal, UUID, date, time, timedelta, type(None))
+
+
+class FragmentCacheExtension(Extension):
+    tags = {"cache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(
+            fragment_cache=LRUCache(settings.JINJA2_FRAGMENT_CACHE_SIZE),
+        )
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+
+        key = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            key.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        # Blocks are told apart by the template they are in, their position in it
+        # and their source, so different blocks can share key values without
+        # clashing, even in templates without a name
+        block_id = parser.free_identifier(lineno).name
+        source_hash = sha1(repr(body).encode()).hexdigest()
+        key.insert(0, nodes.Const(f"{parser.name}:{block_id}:{source_hash}"))
+
+        return nodes.CallBlock(
+            self.call_method("_render_cached", [nodes.List(key)]), [], [], body
+        ).set_lineno(lineno)
+
+    def _render_cached(self, key, caller):
+        for value in key:
+            if not isinstance(value, KEY_TYPES):
+                raise TypeError(
+                    f"{{% cache %}} keys must be scalar values, not {type(value).__name__}"
+                )
+
+        key = sha1(repr(key).encode()).hexdigest()
+        fragment_cache = self.environment.fragment_cache
+
+        html = fragment_cache.get(key)
+        if html is None and settings.JINJA2_FRAGMENT_CACHE_BACKEND:
+            html = caches[settings.JINJA2_FRAGMENT_CACHE_BACKEND].get(
+                f"jinja2_fragment:{key}"
+            )
+            if html is not None:
+                fragment_cache[key] = html
+
+        if html is None:
+            html = str(caller())
+            fragment_cache[key] = html
+            if settings.JINJA2_FRAGMENT_CACHE_BACKEND:
+                caches[settings.JINJA2_FRAGMENT_CACHE_BACKEND].set(
+                    f"jinja2_fragment:{key}",
+                    html,
+                    settings.JINJA2_FRAGMENT_CACHE_TIMEOUT,
+                )
+
+        return Markup(html) if self.environment.autoescape else html
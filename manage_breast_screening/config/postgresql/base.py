@@ -1,5 +1,48 @@
+import threading
+import time
+
 from azure.identity import DefaultAzureCredential
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
 from django.db.backends.postgresql import base
+from django.utils.version import get_version_tuple
+
+
+class AzureTokenProvider:
+    """
+    Fetch Entra tokens to use as the database password, and reuse each one until
+    shortly before it expires.
+
+    Tokens are refreshed ahead of their expiry, so that a new connection is never
+    opened with a token that is about to expire. Only one thread fetches a new
+    token at a time.
+    """
+
+    SCOPE = "https://ossrdbms-aad.database.windows.net/.default"
+
+    # Fetch a new token this many seconds before the current one expires
+    REFRESH_BEFORE_EXPIRY_SECONDS = 5 * 60
+
+    def __init__(self, credential):
+        self.credential = credential
+        self._token = None
+        self._lock = threading.Lock()
+
+    def _needs_refresh(self, token) -> bool:
+        return (
+            token is None
+            or time.time() >= token.expires_on - self.REFRESH_BEFORE_EXPIRY_SECONDS
+        )
+
+    def get_token(self) -> str:
+        token = self._token
+        if self._needs_refresh(token):
+            with self._lock:
+                token = self._token
+                if self._needs_refresh(token):
+                    token = self._token = self.credential.get_token(self.SCOPE)
+
+        return token.token
 
 
 class DatabaseWrapper(base.DatabaseWrapper):
@@ -15,26 +58,89 @@ class DatabaseWrapper(base.DatabaseWrapper):
 
     Unless you disable persistent connections, each thread will maintain its own
     connection.
-    Since Django 5.1 it is possible to configure a connection pool
-    instead of using persistent connections, but that would require us to
-    fix the credentials.
+    Alternatively, set OPTIONS["pool"] to share a psycopg connection pool between
+    threads. The pool calls `get_pool_connection_params` whenever it opens a
+    connection, rather than using the parameters from when it was created, so
+    connections can be reused across requests and threads after the first token
+    has expired. This requires psycopg-pool 3.3 or later.
     See https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+    and https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
     for more details of how this works.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.azure_credential = DefaultAzureCredential()
+        self.azure_token_provider = AzureTokenProvider(self.azure_credential)
+
+    @property
+    def uses_azure_credentials(self) -> bool:
+        return (self.settings_dict["HOST"] or "").endswith(".database.azure.com")
 
     def _get_azure_connection_password(self) -> str:
-        # This makes use of in-memory token caching
-        # https://github.com/Azure/azure-sdk-for-python/blob/main/sdk/identity/azure-identity/TOKEN_CACHING.md#in-memory-token-caching
-        return self.azure_credential.get_token(
-            "https://ossrdbms-aad.database.windows.net/.default"
-        ).token
+        return self.azure_token_provider.get_token()
 
     def get_connection_params(self) -> dict:
         params = super().get_connection_params()
-        if params.get("host", "").endswith(".database.azure.com"):
+        if self.uses_azure_credentials:
             params["password"] = self._get_azure_connection_password()
         return params
+
+    @property
+    def pool(self):
+        """
+        The connection pool, built like Django's except that the pool is given a
+        function to call for the connection parameters, so that each connection
+        it opens uses the current token.
+        """
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        if self.alias == NO_DB_ALIAS or not pool_options:
+            return None
+
+        if self.alias not in self._connection_pools:
+            if self.settings_dict.get("CONN_MAX_AGE", 0) != 0:
+                raise ImproperlyConfigured(
+                    "Pooling doesn't support persistent connections."
+                )
+            if pool_options is True:
+                pool_options = {}
+
+            try:
+                import psycopg_pool
+            except ImportError as err:
+                raise ImproperlyConfigured(
+                    "Error loading psycopg_pool module.\nDid you install psycopg[pool]?"
+                ) from err
+
+            # Callable connection parameters were added in psycopg-pool 3.3
+            if get_version_tuple(psycopg_pool.__version__) < (3, 3):
+                raise ImproperlyConfigured(
+                    f"psycopg-pool 3.3 or later is required to fetch a token for "
+                    f"each pooled connection; {psycopg_pool.__version__} is installed."
+                )
+
+            enable_checks = self.settings_dict["CONN_HEALTH_CHECKS"]
+            pool = psycopg_pool.ConnectionPool(
+                kwargs=self.get_pool_connection_params,
+                open=False,  # Do not open the pool during startup.
+                configure=self._configure_connection,
+                check=(
+                    psycopg_pool.ConnectionPool.check_connection
+                    if enable_checks
+                    else None
+                ),
+                **pool_options,
+            )
+            # As in Django, the first thread to set the pool wins
+            self._connection_pools.setdefault(self.alias, pool)
+
+        return self._connection_pools[self.alias]
+
+    def get_pool_connection_params(self) -> dict:
+        """
+        Called by the pool each time it opens a connection
+        """
+        params = self.get_connection_params()
+        # Ensure we run in autocommit, Django properly sets it later on.
+        params["autocommit"] = True
+        return params
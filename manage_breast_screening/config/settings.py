@@ -67,6 +67,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "manage_breast_screening.core.request_metrics.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -110,6 +111,23 @@ TEMPLATES = [
     },
 ]
 
+# Directory to cache compiled Jinja templates in. Populate it with
+# `manage.py compile_templates`.
+JINJA2_BYTECODE_CACHE_DIR = environ.get("JINJA2_BYTECODE_CACHE_DIR")
+
+# Remember which loader each template comes from, and stop checking whether
+# templates have changed. Disable this when editing templates.
+JINJA2_MEMOISE_LOADERS = boolean_env("JINJA2_MEMOISE_LOADERS", default=not DEBUG)
+
+# Rendered {% cache %} blocks to keep in each process, and optionally the name
+# of a Django cache to share them between processes.
+JINJA2_FRAGMENT_CACHE_SIZE = int(environ.get("JINJA2_FRAGMENT_CACHE_SIZE", "1000"))
+JINJA2_FRAGMENT_CACHE_BACKEND = environ.get("JINJA2_FRAGMENT_CACHE_BACKEND")
+JINJA2_FRAGMENT_CACHE_TIMEOUT = int(environ.get("JINJA2_FRAGMENT_CACHE_TIMEOUT", "300"))
+
+# Stream long pages, such as clinics, to the browser as they are rendered
+STREAMING_RESPONSES = boolean_env("STREAMING_RESPONSES", default=False)
+
 WSGI_APPLICATION = "manage_breast_screening.config.wsgi.application"
 
 
@@ -128,6 +146,15 @@ DATABASES = {
     }
 }
 
+# Share a pool of connections between threads, instead of each thread holding its
+# own connection. Requires psycopg[pool].
+# https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
+if boolean_env("DATABASE_POOL", default=False):
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(environ.get("DATABASE_POOL_MIN_SIZE", "2")),
+        "max_size": int(environ.get("DATABASE_POOL_MAX_SIZE", "10")),
+    }
+
 STORAGES = {
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
@@ -225,4 +252,26 @@ LOGGING = {
     },
 }
 
+# Thresholds above which RequestMetricsMiddleware logs a request as a warning
+REQUEST_METRICS_SLOW_REQUEST_MS = int(
+    environ.get("REQUEST_METRICS_SLOW_REQUEST_MS", "1000")
+)
+REQUEST_METRICS_MAX_QUERIES = int(environ.get("REQUEST_METRICS_MAX_QUERIES", "50"))
+# Maximum number of times the same SQL can run in one request (N+1 detection)
+REQUEST_METRICS_MAX_DUPLICATE_QUERIES = int(
+    environ.get("REQUEST_METRICS_MAX_DUPLICATE_QUERIES", "5")
+)
+# Send query counts and timings to the client in a Server-Timing header. This
+# exposes details of the database, so is only on by default in development.
+REQUEST_METRICS_SERVER_TIMING = boolean_env(
+    "REQUEST_METRICS_SERVER_TIMING", default=DEBUG
+)
+
+# Cache the clinic list filter counts for this many seconds (0 disables caching)
+CLINIC_FILTER_COUNTS_CACHE_TIMEOUT = int(
+    environ.get("CLINIC_FILTER_COUNTS_CACHE_TIMEOUT", "0")
+)
+
 AUDIT_EXCLUDED_FIELDS = ["password", "token", "created_at", "updated_at", "id"]
+# Maximum number of audit logs to insert per query when auditing in bulk
+AUDIT_BATCH_SIZE = int(environ.get("AUDIT_BATCH_SIZE", "1000"))
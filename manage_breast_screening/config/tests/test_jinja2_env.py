@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+from jinja2 import DictLoader, Environment, TemplateNotFound
+
+from ..jinja2_env import MemoisedChoiceLoader
+
+
+class TestMemoisedChoiceLoader:
+    @pytest.fixture
+    def loaders(self):
+        return [
+            DictLoader({"first.jinja": "first"}),
+            DictLoader({"first.jinja": "shadowed", "second.jinja": "second"}),
+        ]
+
+    def test_loads_from_the_first_loader_with_the_template(self, loaders):
+        env = Environment(loader=MemoisedChoiceLoader(loaders))
+
+        assert env.get_template("first.jinja").render() == "first"
+        assert env.get_template("second.jinja").render() == "second"
+
+    def test_remembers_which_loader_has_the_template(self, loaders):
+        loader = MemoisedChoiceLoader(loaders)
+        env = Environment(loader=loader)
+        loader.get_source(env, "second.jinja")
+
+        with patch.object(
+            loaders[0], "get_source", side_effect=TemplateNotFound("")
+        ) as first:
+            source, _, uptodate = loader.get_source(env, "second.jinja")
+
+        assert source == "second"
+        assert uptodate()
+        first.assert_not_called()
+
+    def test_raises_when_no_loader_has_the_template(self, loaders):
+        env = Environment(loader=MemoisedChoiceLoader(loaders))
+
+        with pytest.raises(TemplateNotFound):
+            env.get_template("missing.jinja")
@@ -0,0 +1,99 @@
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from jinja2 import DictLoader, Environment
+from markupsafe import Markup
+
+from ..jinja2_fragment_cache import FragmentCacheExtension
+
+
+@pytest.fixture
+def render_count():
+    return Mock(side_effect=lambda value: f"<b>{value}</b>")
+
+
+@pytest.fixture
+def env(render_count):
+    env = Environment(
+        autoescape=True,
+        extensions=[FragmentCacheExtension],
+        loader=DictLoader(
+            {
+                "page.jinja": (
+                    "{% for value in values %}"
+                    "{% cache value %}{{ render(value) | safe }}{% endcache %}"
+                    "{% endfor %}"
+                    "|{% cache values[0] %}other {{ values[0] }}{% endcache %}"
+                ),
+            }
+        ),
+    )
+    env.globals["render"] = render_count
+    return env
+
+
+def test_renders_each_distinct_key_once(env, render_count):
+    output = env.get_template("page.jinja").render(values=["a", "b", "a", "a"])
+
+    assert output == "<b>a</b><b>b</b><b>a</b><b>a</b>|other a"
+    assert render_count.call_count == 2
+
+
+def test_reuses_fragments_between_renders(env, render_count):
+    env.get_template("page.jinja").render(values=["a"])
+    env.get_template("page.jinja").render(values=["a"])
+
+    assert render_count.call_count == 1
+
+
+def test_escapes_values_in_cached_blocks(env):
+    output = env.get_template("page.jinja").render(values=["<i>"])
+
+    assert output == "<b><i></b>|other &lt;i&gt;"
+
+
+def test_cache_is_bounded(settings, render_count):
+    settings.JINJA2_FRAGMENT_CACHE_SIZE = 2
+    env = Environment(extensions=[FragmentCacheExtension])
+    env.globals["render"] = render_count
+    template = env.from_string("{% cache value %}{{ render(value) }}{% endcache %}")
+
+    for value in ["a", "b", "c", "a"]:
+        template.render(value=value)
+
+    assert render_count.call_count == 4
+
+
+def test_shares_fragments_through_the_django_cache(settings, render_count):
+    settings.JINJA2_FRAGMENT_CACHE_BACKEND = "default"
+    cache.clear()
+    source = "{% cache value %}{{ render(value) }}{% endcache %}"
+
+    for _ in range(2):
+        env = Environment(autoescape=True, extensions=[FragmentCacheExtension])
+        env.globals["render"] = render_count
+        assert env.from_string(source).render(value="a") == Markup(
+            "&lt;b&gt;a&lt;/b&gt;"
+        )
+
+    assert render_count.call_count == 1
+
+
+def test_blocks_in_unnamed_templates_do_not_share_fragments(render_count):
+    env = Environment(extensions=[FragmentCacheExtension])
+    env.globals["render"] = render_count
+
+    first = env.from_string("{% cache value %}first {{ value }}{% endcache %}")
+    second = env.from_string("{% cache value %}second {{ value }}{% endcache %}")
+
+    assert first.render(value="a") == "first a"
+    assert second.render(value="a") == "second a"
+
+
+def test_keys_must_be_scalar_values():
+    env = Environment(extensions=[FragmentCacheExtension])
+    template = env.from_string("{% cache value %}{{ value }}{% endcache %}")
+
+    with pytest.raises(TypeError, match="scalar"):
+        template.render(value=object())
@@ -0,0 +1,78 @@
+from copy import deepcopy
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.credentials import AccessToken
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+
+from ..postgresql.base import AzureTokenProvider, DatabaseWrapper
+
+NOW = 1_750_000_000
+
+
+class FakeCredential:
+    def __init__(self, lifetime=3600):
+        self.lifetime = lifetime
+        self.calls = 0
+
+    def get_token(self, scope):
+        self.calls += 1
+        return AccessToken(f"token-{self.calls}", NOW + self.lifetime)
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = MagicMock(return_value=NOW)
+    monkeypatch.setattr("time.time", clock)
+    return clock
+
+
+class TestAzureTokenProvider:
+    def test_reuses_token_until_shortly_before_expiry(self, now):
+        credential = FakeCredential()
+        provider = AzureTokenProvider(credential)
+
+        assert provider.get_token() == "token-1"
+
+        now.return_value = NOW + 3600 - provider.REFRESH_BEFORE_EXPIRY_SECONDS - 1
+        assert provider.get_token() == "token-1"
+
+        now.return_value = NOW + 3600 - provider.REFRESH_BEFORE_EXPIRY_SECONDS
+        assert provider.get_token() == "token-2"
+        assert credential.calls == 2
+
+
+class TestDatabaseWrapper:
+    @pytest.fixture
+    def wrapper(self, now):
+        settings_dict = deepcopy(connection.settings_dict)
+        settings_dict["HOST"] = "example.postgres.database.azure.com"
+        settings_dict["CONN_MAX_AGE"] = 0
+        settings_dict["OPTIONS"]["pool"] = {"min_size": 1, "max_size": 2}
+
+        wrapper = DatabaseWrapper(settings_dict, alias="azure_pool_test")
+        wrapper.azure_token_provider = AzureTokenProvider(FakeCredential())
+        yield wrapper
+        DatabaseWrapper._connection_pools.pop("azure_pool_test", None)
+
+    def test_connection_params(self, wrapper):
+        assert wrapper.get_connection_params()["password"] == "token-1"
+
+    def test_pool_fetches_current_token_for_each_connection(self, wrapper, now):
+        pool = wrapper.pool
+
+        assert pool.kwargs == wrapper.get_pool_connection_params
+        assert pool.kwargs()["password"] == "token-1"
+
+        now.return_value = NOW + 3600
+        params = pool.kwargs()
+        assert params["password"] == "token-2"
+        assert params["host"] == "example.postgres.database.azure.com"
+        assert params["autocommit"] is True
+
+    def test_pool_requires_psycopg_pool_3_3(self, wrapper, monkeypatch):
+        monkeypatch.setattr("psycopg_pool.__version__", "3.2.6")
+
+        with pytest.raises(ImproperlyConfigured, match="psycopg-pool 3.3 or later"):
+            wrapper.pool
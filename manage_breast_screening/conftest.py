@@ -0,0 +1,21 @@
+import pytest
+from django.template.backends.jinja2 import Template
+from django.test.signals import template_rendered
+
+
+@pytest.fixture(autouse=True, scope="session")
+def instrument_jinja2_templates():
+    """
+    Send the template_rendered signal when a Jinja template is rendered, as Django
+    only does this for its own templates, so that the test client records Jinja
+    templates in response.templates and assertTemplateUsed works with them.
+    """
+    original_render = Template.render
+
+    def render(self, context=None, request=None):
+        template_rendered.send(sender=self, template=self.template, context=context)
+        return original_render(self, context, request)
+
+    Template.render = render
+    yield
+    Template.render = original_render
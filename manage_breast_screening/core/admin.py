@@ -1,5 +1,126 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import SuspiciousOperation, ValidationError
+from django.shortcuts import get_object_or_404, redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html
+from django.utils.http import urlencode
 
 from .models import AuditLog
+from .services.audit_history import AuditHistory, InvalidCursorError
 
-admin.site.register(AuditLog)
+# Query parameter marking a changelist that should list every date, rather than
+# defaulting to the current month
+ALL_DATES_VAR = "all_dates"
+
+
+class AuditLogChangeList(ChangeList):
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(ALL_DATES_VAR, None)
+        return lookup_params
+
+
+@admin.register(AuditLog)
+class AuditLogAdmin(admin.ModelAdmin):
+    """
+    Audit logs are listed a month at a time by default, so that queries only need
+    to read the partitions for the selected dates when the table is partitioned.
+    The date hierarchy's "All dates" link adds ALL_DATES_VAR to opt out of this.
+
+    The history view pages through the audit trail of a single object, actor or
+    system update using AuditHistory.
+    """
+
+    date_hierarchy = "created_at"
+    list_display = [
+        "created_at",
+        "operation",
+        "content_type",
+        "object_id",
+        "actor",
+        "system_update_id",
+        "object_history",
+    ]
+    list_filter = ["operation", "content_type"]
+    list_select_related = ["content_type", "actor"]
+    ordering = ["-created_at"]
+    show_full_result_count = False
+
+    def get_urls(self):
+        return [
+            path(
+                "history/",
+                self.admin_site.admin_view(self.audit_history_view),
+                name="core_auditlog_audit_history",
+            ),
+        ] + super().get_urls()
+
+    @admin.display(description="History")
+    def object_history(self, log):
+        url = reverse("admin:core_auditlog_audit_history")
+        query = urlencode(
+            {"content_type": log.content_type_id, "object_id": log.object_id}
+        )
+        return format_html('<a href="{}?{}">View history</a>', url, query)
+
+    def get_changelist(self, request, **kwargs):
+        return AuditLogChangeList
+
+    def changelist_view(self, request, extra_context=None):
+        if ALL_DATES_VAR not in request.GET and not any(
+            key.startswith("created_at") for key in request.GET
+        ):
+            today = timezone.localdate()
+            query = request.GET.copy()
+            query["created_at__year"] = today.year
+            query["created_at__month"] = today.month
+            return redirect(f"{request.path}?{query.urlencode()}")
+
+        return super().changelist_view(request, extra_context)
+
+    def audit_history_view(self, request):
+        params = request.GET.copy()
+        cursor = params.pop("cursor", [None])[0]
+
+        try:
+            if "object_id" in params:
+                content_type = get_object_or_404(
+                    ContentType, pk=params.get("content_type")
+                )
+                history = AuditHistory.for_object_id(content_type, params["object_id"])
+                subject = f"{content_type} {params['object_id']}"
+            elif "actor" in params:
+                history = AuditHistory.for_actor(params["actor"])
+                subject = f"actor {params['actor']}"
+            elif "system_update_id" in params:
+                history = AuditHistory.for_system_update(params["system_update_id"])
+                subject = f"system update {params['system_update_id']}"
+            else:
+                raise SuspiciousOperation(
+                    "Audit history requires an object_id, actor or system_update_id"
+                )
+
+            page = history.page(cursor)
+        except (InvalidCursorError, ValidationError, ValueError) as e:
+            raise SuspiciousOperation(str(e)) from e
+
+        next_url = None
+        if page.next_cursor:
+            params["cursor"] = page.next_cursor
+            next_url = f"{request.path}?{params.urlencode()}"
+
+        return TemplateResponse(
+            request,
+            "admin/core/auditlog/audit_history.html",
+            {
+                **self.admin_site.each_context(request),
+                "opts": self.model._meta,
+                "title": f"Audit history for {subject}",
+                "page": page,
+                "next_url": next_url,
+            },
+        )
@@ -0,0 +1,284 @@
+import json
+import logging
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from itertools import cycle
+
+import pytest
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ..clinics.models import Clinic, ClinicSlot, ClinicStatus
+from ..clinics.tests.factories import (
+    ClinicFactory,
+    ClinicSlotFactory,
+    ClinicStatusFactory,
+    SettingFactory,
+)
+from ..participants.models import (
+    Appointment,
+    AppointmentStatus,
+    Participant,
+    ParticipantAddress,
+    ScreeningEpisode,
+)
+from ..participants.tests.factories import (
+    AppointmentFactory,
+    AppointmentStatusFactory,
+    ParticipantAddressFactory,
+    ParticipantFactory,
+    ScreeningEpisodeFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+# Status histories that seeded appointments work through, oldest first
+STATUS_HISTORIES = [
+    [AppointmentStatus.CONFIRMED],
+    [AppointmentStatus.CONFIRMED, AppointmentStatus.CHECKED_IN],
+    [
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CHECKED_IN,
+        AppointmentStatus.SCREENED,
+    ],
+    [AppointmentStatus.CONFIRMED, AppointmentStatus.DID_NOT_ATTEND],
+    [
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CHECKED_IN,
+        AppointmentStatus.ATTENDED_NOT_SCREENED,
+    ],
+]
+
+
+@dataclass
+class Measurement:
+    name: str
+    queries: int
+    seconds: float
+    peak_memory_kb: float
+
+
+@dataclass
+class Budget:
+    queries: int
+    seconds: float = 1.0
+    peak_memory_kb: float = 10_000
+
+
+@pytest.mark.benchmark
+class BenchmarkTestCase(TestCase):
+    """
+    Seed a realistic volume of data once per test class, and measure the
+    number of queries, wall time and peak allocated memory of requests
+    against it.
+
+    Wall time is only checked against budgets if BENCHMARK_ENFORCE_SECONDS is
+    set, as it varies too much between machines to fail CI on.
+    Set BENCHMARK_RESULTS_FILE to append each measurement to a JSON lines file.
+    """
+
+    NUMBER_OF_SETTINGS = 10
+    NUMBER_OF_CLINICS = 300
+    SLOTS_PER_CLINIC = 10
+    SLOTS_IN_BUSY_CLINIC = 60
+    # Clinics are spread over this many days, centred on today
+    CLINIC_DAYS = 15
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed()
+
+    @classmethod
+    def seed(cls):
+        """
+        Bulk insert clinics, slots, participants and appointments built by
+        the factories. Each participant has a previous screening episode,
+        and each appointment has a status history.
+        """
+        today = timezone.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        first_day = today - timedelta(days=cls.CLINIC_DAYS // 2)
+        settings = SettingFactory.create_batch(cls.NUMBER_OF_SETTINGS)
+
+        clinics = Clinic.objects.bulk_create(
+            ClinicFactory.build(
+                setting=setting,
+                starts_at=first_day + timedelta(days=i % cls.CLINIC_DAYS, minutes=i),
+                ends_at=first_day
+                + timedelta(days=i % cls.CLINIC_DAYS, minutes=i, hours=6),
+            )
+            for i, setting in zip(range(cls.NUMBER_OF_CLINICS), cycle(settings))
+        )
+        cls.busy_clinic = clinics[0]
+        cls.busy_clinic.starts_at = today
+        cls.busy_clinic.save()
+
+        ClinicStatus.objects.bulk_create(
+            ClinicStatusFactory.build(clinic=clinic) for clinic in clinics
+        )
+
+        slots = ClinicSlot.objects.bulk_create(
+            ClinicSlotFactory.build(
+                clinic=clinic,
+                starts_at=clinic.starts_at + timedelta(minutes=6 * n),
+                duration_in_minutes=6,
+            )
+            for clinic in clinics
+            for n in range(
+                cls.SLOTS_IN_BUSY_CLINIC
+                if clinic == cls.busy_clinic
+                else cls.SLOTS_PER_CLINIC
+            )
+        )
+
+        participants = Participant.objects.bulk_create(
+            ParticipantFactory.build_batch(len(slots))
+        )
+        ParticipantAddress.objects.bulk_create(
+            ParticipantAddressFactory.build(participant=participant)
+            for participant in participants
+        )
+        ScreeningEpisode.objects.bulk_create(
+            ScreeningEpisodeFactory.build(participant=participant)
+            for participant in participants
+        )
+        episodes = ScreeningEpisode.objects.bulk_create(
+            ScreeningEpisodeFactory.build(participant=participant)
+            for participant in participants
+        )
+
+        histories = [
+            STATUS_HISTORIES[i % len(STATUS_HISTORIES)] for i in range(len(slots))
+        ]
+        appointments = Appointment.objects.bulk_create(
+            AppointmentFactory.build(
+                clinic_slot=slot, screening_episode=episode, current_state=history[-1]
+            )
+            for slot, episode, history in zip(slots, episodes, histories)
+        )
+        AppointmentStatus.objects.bulk_create(
+            AppointmentStatusFactory.build(appointment=appointment, state=state)
+            for appointment, history in zip(appointments, histories)
+            for state in history
+        )
+
+        # Without statistics on the freshly seeded tables the query planner can
+        # choose plans that would never be used in production
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        cls.busy_appointment = (
+            Appointment.objects.filter(clinic_slot__clinic=cls.busy_clinic)
+            .order_by("clinic_slot__starts_at")
+            .first()
+        )
+        cls.participant = cls.busy_appointment.screening_episode.participant
+
+    def measure(self, name, request):
+        """
+        Make a request once to warm up caches, then again to count queries and
+        time it, and a third time to trace memory allocations (which slows
+        everything else down).
+
+        Database changes are rolled back after each run, so that requests that
+        change data, such as form submissions, start from the same state every
+        time.
+        """
+        with transaction.atomic():
+            request()
+            transaction.set_rollback(True)
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = request()
+                seconds = time.perf_counter() - start
+            transaction.set_rollback(True)
+
+        # the query log is reset at the start of every request, so take a copy
+        queries = context.captured_queries
+
+        with transaction.atomic():
+            tracemalloc.start()
+            try:
+                request()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            transaction.set_rollback(True)
+
+        measurement = Measurement(
+            name=name,
+            queries=len(queries),
+            seconds=seconds,
+            peak_memory_kb=peak / 1024,
+        )
+        self.record(measurement)
+
+        return response, measurement, queries
+
+    def record(self, measurement):
+        logger.info(json.dumps(asdict(measurement)))
+
+        path = os.environ.get("BENCHMARK_RESULTS_FILE")
+        if path:
+            with open(path, "a") as f:
+                f.write(json.dumps(asdict(measurement)) + "\n")
+
+    def explain(self, queryset) -> str:
+        """
+        The query plan for a queryset, with sequential and bitmap scans disabled.
+        The seeded tables are small enough that scanning them is often cheapest, so
+        this shows the plan that would be used for a production-sized table instead.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+            cursor.execute("SET enable_bitmapscan = off")
+            try:
+                return queryset.explain()
+            finally:
+                cursor.execute("RESET enable_seqscan")
+                cursor.execute("RESET enable_bitmapscan")
+
+    def assertUsesIndex(self, queryset, index_name, index_only=False):
+        """
+        Fail unless the query reads from the index, in order, without a sort.
+        """
+        plan = self.explain(queryset)
+        scan = "Index Only Scan" if index_only else "Index Scan"
+
+        self.assertIn(f"{scan} using {index_name} ", plan, plan)
+        self.assertNotIn("Sort", plan, plan)
+
+    def assertWithinBudget(self, name, request, budget: Budget):
+        """
+        Measure a request and fail if it makes more queries or allocates more
+        memory than the budget allows, or takes longer if BENCHMARK_ENFORCE_SECONDS
+        is set.
+        """
+        response, measurement, queries = self.measure(name, request)
+
+        self.assertLess(response.status_code, 400, name)
+        self.assertLessEqual(
+            measurement.queries,
+            budget.queries,
+            f"{name} made {measurement.queries} queries:\n"
+            + "\n".join(query["sql"] for query in queries),
+        )
+        if os.environ.get("BENCHMARK_ENFORCE_SECONDS"):
+            self.assertLessEqual(
+                measurement.seconds,
+                budget.seconds,
+                f"{name} took {measurement.seconds:.3f}s",
+            )
+        self.assertLessEqual(
+            measurement.peak_memory_kb,
+            budget.peak_memory_kb,
+            f"{name} allocated {measurement.peak_memory_kb:.0f}KB",
+        )
+
+        return response
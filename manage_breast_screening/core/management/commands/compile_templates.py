@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every Jinja template, including the nhsuk_frontend_jinja components, "
+        "into the bytecode cache in JINJA2_BYTECODE_CACHE_DIR"
+    )
+
+    def handle(self, *args, **options):
+        env = engines["jinja2"].env
+        if env.bytecode_cache is None:
+            raise CommandError("Set JINJA2_BYTECODE_CACHE_DIR to compile templates")
+
+        names = env.list_templates(extensions=["jinja"])
+        for name in names:
+            env.get_template(name)
+
+        self.stdout.write(f"Compiled {len(names)} templates")
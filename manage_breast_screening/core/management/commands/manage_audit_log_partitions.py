@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...services import audit_log_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming monthly partitions of the audit log table, and detach "
+        "partitions older than the retention period"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert the audit log table to a partitioned table first. "
+            "This rewrites the table while holding an exclusive lock on it.",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Number of future months to create partitions for",
+        )
+        parser.add_argument(
+            "--retain-months",
+            type=int,
+            help="Detach partitions older than this many months",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop detached partitions rather than leaving them to be archived",
+        )
+
+    def handle(self, *args, **options):
+        if options["convert"]:
+            if audit_log_partitions.is_partitioned():
+                raise CommandError("The audit log table is already partitioned")
+            audit_log_partitions.convert_to_partitioned(options["months_ahead"])
+            self.stdout.write("Converted the audit log table to a partitioned table")
+        elif not audit_log_partitions.is_partitioned():
+            raise CommandError(
+                "The audit log table is not partitioned. Run with --convert first."
+            )
+
+        for month in audit_log_partitions.create_partitions(options["months_ahead"]):
+            self.stdout.write(
+                f"Created partition {audit_log_partitions.partition_name(month)}"
+            )
+
+        if options["retain_months"] is not None:
+            for month in audit_log_partitions.detach_partitions(
+                options["retain_months"], drop=options["drop"]
+            ):
+                name = audit_log_partitions.partition_name(month)
+                self.stdout.write(
+                    f"Dropped partition {name}"
+                    if options["drop"]
+                    else f"Detached partition {name}"
+                )
@@ -0,0 +1,178 @@
+"""
+Per-request performance metrics: database queries, template rendering and
+overall view time.
+
+See `RequestMetricsMiddleware`, which logs a summary of every request and
+adds a Server-Timing header to the response.
+"""
+
+import json
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from logging import INFO, WARNING, getLogger
+
+from django.conf import settings
+from django.db import connections
+
+logger = getLogger(__name__)
+
+_current_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.query_count = 0
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.view_seconds = 0.0
+        self.first_byte_seconds = None
+        self.queries_by_sql = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper, which times every query
+        https://docs.djangoproject.com/en/5.2/topics/db/instrumentation/
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+            self.query_count += 1
+            self.queries_by_sql[sql] += 1
+
+    @property
+    def most_duplicated_query(self) -> tuple[str, int] | None:
+        """
+        The SQL that was executed the most times, and how many times it was executed.
+        Repeated SQL with different parameters is a sign of an N+1 query.
+        """
+        most_common = self.queries_by_sql.most_common(1)
+        return most_common[0] if most_common else None
+
+    def warnings(self) -> list[str]:
+        result = []
+
+        if self.view_seconds * 1000 > settings.REQUEST_METRICS_SLOW_REQUEST_MS:
+            result.append("slow_request")
+
+        if self.query_count > settings.REQUEST_METRICS_MAX_QUERIES:
+            result.append("too_many_queries")
+
+        duplicated = self.most_duplicated_query
+        if (
+            duplicated
+            and duplicated[1] > settings.REQUEST_METRICS_MAX_DUPLICATE_QUERIES
+        ):
+            result.append("duplicate_queries")
+
+        return result
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.db_seconds * 1000:.1f};desc="{self.query_count} queries"',
+                f"template;dur={self.template_seconds * 1000:.1f}",
+                f"view;dur={self.view_seconds * 1000:.1f}",
+            ]
+        )
+
+
+def current_metrics() -> RequestMetrics | None:
+    """
+    The metrics for the request currently being handled, if any.
+    """
+    return _current_metrics.get()
+
+
+@contextmanager
+def record_metrics(metrics: RequestMetrics | None = None):
+    """
+    Record metrics for everything that happens inside the context, adding to
+    `metrics` if given.
+    """
+    metrics = metrics or RequestMetrics()
+    token = _current_metrics.set(metrics)
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            yield metrics
+    finally:
+        metrics.view_seconds += time.perf_counter() - start
+        _current_metrics.reset(token)
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the number of queries, database time, template rendering time and
+    total view time for each request.
+
+    Each request is logged as a single line of JSON. Requests that exceed
+    the REQUEST_METRICS_* thresholds are logged as warnings, with the reasons
+    listed in the "warnings" key.
+
+    Streaming responses are rendered after the view returns, so their metrics
+    keep being recorded while each chunk is generated, and they are logged once
+    the response has been sent, along with the time to the first chunk. Their
+    Server-Timing header only covers the view itself.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with record_metrics() as metrics:
+            response = self.get_response(request)
+
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing()
+
+        if response.streaming:
+            response.streaming_content = self.measure_streaming(
+                request, response, metrics, iter(response.streaming_content)
+            )
+        else:
+            self.log(request, response, metrics)
+
+        return response
+
+    def measure_streaming(self, request, response, metrics, chunks):
+        try:
+            while True:
+                with record_metrics(metrics):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                if metrics.first_byte_seconds is None:
+                    metrics.first_byte_seconds = metrics.view_seconds
+                yield chunk
+        finally:
+            self.log(request, response, metrics)
+
+    def log(self, request, response, metrics):
+        warnings = metrics.warnings()
+        summary = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": metrics.query_count,
+            "db_ms": round(metrics.db_seconds * 1000, 1),
+            "template_ms": round(metrics.template_seconds * 1000, 1),
+            "view_ms": round(metrics.view_seconds * 1000, 1),
+        }
+
+        if metrics.first_byte_seconds is not None:
+            summary["first_byte_ms"] = round(metrics.first_byte_seconds * 1000, 1)
+
+        if warnings:
+            summary["warnings"] = warnings
+
+        if "duplicate_queries" in warnings:
+            sql, count = metrics.most_duplicated_query
+            summary["duplicate_query"] = {"sql": sql, "count": count}
+
+        logger.log(WARNING if warnings else INFO, json.dumps(summary))
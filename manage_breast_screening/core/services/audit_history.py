@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+
+from ..models import AuditLog
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class AuditHistoryPage:
+    logs: list[AuditLog]
+    next_cursor: str | None
+
+
+class AuditHistory:
+    """
+    Read back the audit trail for an object, an actor or a system update, newest
+    first.
+
+    Results are paginated by keyset rather than by offset: each page continues
+    from the (created_at, id) of the last log on the previous page, so fetching
+    a page reads from the relevant index no matter how far back it is.
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, queryset):
+        self.queryset = queryset.select_related("content_type", "actor").order_by(
+            "-created_at", "-id"
+        )
+
+    @classmethod
+    def for_object(cls, object):
+        return cls.for_object_id(ContentType.objects.get_for_model(object), object.pk)
+
+    @classmethod
+    def for_object_id(cls, content_type, object_id):
+        return cls(
+            AuditLog.objects.filter(content_type=content_type, object_id=object_id)
+        )
+
+    @classmethod
+    def for_actor(cls, actor):
+        return cls(AuditLog.objects.filter(actor=actor))
+
+    @classmethod
+    def for_system_update(cls, system_update_id):
+        return cls(AuditLog.objects.filter(system_update_id=system_update_id))
+
+    @staticmethod
+    def encode_cursor(log: AuditLog) -> str:
+        return f"{log.created_at.isoformat()}_{log.pk}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        try:
+            created_at, pk = cursor.split("_")
+            return datetime.fromisoformat(created_at), UUID(pk)
+        except ValueError as e:
+            raise InvalidCursorError(f"Invalid audit history cursor {cursor!r}") from e
+
+    def page(self, cursor: str | None = None, limit: int | None = None):
+        """
+        Fetch up to `limit` logs following on from `cursor`, or the most recent
+        logs if there is no cursor.
+        """
+        limit = limit or self.PAGE_SIZE
+        queryset = self.queryset
+
+        if cursor:
+            created_at, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lte=created_at)
+                & (Q(created_at__lt=created_at) | Q(id__lt=pk))
+            )
+
+        # Fetch one extra log to find out if there is another page
+        logs = list(queryset[: limit + 1])
+        has_next = len(logs) > limit
+        logs = logs[:limit]
+
+        return AuditHistoryPage(
+            logs=logs,
+            next_cursor=self.encode_cursor(logs[-1]) if has_next else None,
+        )
+
+    def __iter__(self):
+        """
+        Stream the whole history a page at a time, without holding more than one
+        page in memory.
+        """
+        cursor = None
+        while True:
+            page = self.page(cursor)
+            yield from page.logs
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
@@ -0,0 +1,265 @@
+"""
+Monthly range partitioning of the audit log table by created_at.
+
+The table is partitioned with `convert_to_partitioned`, after which new
+partitions need to be created ahead of time with `create_partitions`, and old
+ones can be detached from the table with `detach_partitions`. Detached
+partitions are left as ordinary tables, so they can be archived before they
+are dropped.
+
+Any rows that fall outside of the monthly partitions are stored in a default
+partition, so that writing an audit log never fails because a partition is
+missing. When a partition is created for a month that already has rows in the
+default partition, those rows are moved into the new partition.
+
+Django's migrations don't know about any of this: the migration state still
+describes an ordinary table with `id` as its primary key. Any migration that
+alters the audit log table needs to be checked against the partitioned table,
+and any index or constraint it adds must be valid on a partitioned table.
+"""
+
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+from ..models import AuditLog
+
+TABLE = AuditLog._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{TABLE}_p{month.year:04}_{month.month:02}"
+
+
+def is_partitioned() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass)",
+            [TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def partitions() -> list[date]:
+    """
+    The months that currently have a partition, oldest first
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    months = []
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+
+    return sorted(months)
+
+
+def _create_partition(cursor, month: date):
+    """
+    Create the partition for a month, moving any rows for that month out of the
+    default partition.
+
+    A partition can't be attached while the default partition holds rows that
+    belong in it, so the default partition is detached while the rows are moved.
+    This needs to run in a transaction, so that no audit logs are written while
+    the default partition is detached.
+    """
+    qn = connection.ops.quote_name
+    table, default, name = qn(TABLE), qn(DEFAULT_PARTITION), qn(partition_name(month))
+    bounds = [f"{month} 00:00:00+00", f"{add_months(month, 1)} 00:00:00+00"]
+
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {default} "
+        "WHERE created_at >= %s AND created_at < %s)",
+        bounds,
+    )
+    if not cursor.fetchone()[0]:
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table}
+            FOR VALUES FROM (%s) TO (%s)
+            """,
+            bounds,
+        )
+        return
+
+    cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+    cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+    cursor.execute(
+        f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+        bounds,
+    )
+    cursor.execute(
+        f"INSERT INTO {name} SELECT * FROM {default} "
+        "WHERE created_at >= %s AND created_at < %s",
+        bounds,
+    )
+    cursor.execute(
+        f"DELETE FROM {default} WHERE created_at >= %s AND created_at < %s",
+        bounds,
+    )
+    cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+
+
+@transaction.atomic
+def convert_to_partitioned(months_ahead: int = 3, today: date | None = None):
+    """
+    Replace the audit log table with a partitioned copy of it, with a partition
+    for each month from the oldest audit log to `months_ahead` months from today.
+
+    The primary key of a partitioned table has to include the partition key,
+    so it becomes (id, created_at). All other indexes, unique constraints and
+    foreign keys are recreated as they were. Unique constraints and indexes
+    must already include created_at, as Postgres can't enforce them across
+    partitions otherwise.
+
+    This rewrites the whole table while holding an exclusive lock on it. The
+    migration state is not updated; see the module docstring.
+    """
+    old_table = f"{TABLE}_unpartitioned"
+    this_month = (today or date.today()).replace(day=1)
+    qn = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        # Check deferred foreign keys now, as the old table can't be dropped while
+        # there are checks pending on it
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+        # The table may not be in the public schema, so qualify every name with
+        # the schema it is actually in
+        cursor.execute(
+            """
+            SELECT nspname, quote_ident(nspname) FROM pg_class
+            JOIN pg_namespace ON pg_namespace.oid = pg_class.relnamespace
+            WHERE pg_class.oid = %s::regclass
+            """,
+            [TABLE],
+        )
+        schema_name, schema = cursor.fetchone()
+        table = f"{schema}.{qn(TABLE)}"
+        old = f"{schema}.{qn(old_table)}"
+
+        cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {qn(old_table)}")
+
+        # Index definitions name the table as pg_get_indexdef quotes it, so
+        # build the same name to replace it with the new table's
+        cursor.execute(
+            """
+            SELECT indexdef, quote_ident(schemaname) || '.' || quote_ident(tablename)
+            FROM pg_indexes
+            WHERE schemaname = %s AND tablename = %s
+            AND indexname NOT IN (
+                SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass
+            )
+            """,
+            [schema_name, old_table, old],
+        )
+        indexes = [
+            indexdef.replace(f" ON {indexed_table} ", f" ON {table} ")
+            for indexdef, indexed_table in cursor.fetchall()
+        ]
+
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype IN ('u', 'f')
+            ORDER BY contype DESC
+            """,
+            [old],
+        )
+        constraints = cursor.fetchall()
+
+        cursor.execute(f"SELECT min(created_at) FROM {old}")
+        oldest = cursor.fetchone()[0]
+        first_month = oldest.date().replace(day=1) if oldest else this_month
+
+        cursor.execute(
+            f"""
+            CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+            PARTITION BY RANGE (created_at)
+            """
+        )
+        cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+        cursor.execute(
+            f"CREATE TABLE {schema}.{qn(DEFAULT_PARTITION)} PARTITION OF {table} DEFAULT"
+        )
+
+        month = min(first_month, this_month)
+        while month <= add_months(this_month, months_ahead):
+            _create_partition(cursor, month)
+            month = add_months(month, 1)
+
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+        cursor.execute(f"DROP TABLE {old}")
+
+        for indexdef in indexes:
+            cursor.execute(indexdef)
+        for name, definition in constraints:
+            cursor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {qn(name)} {definition}"
+            )
+
+
+@transaction.atomic
+def create_partitions(months_ahead: int = 3, today: date | None = None) -> list[date]:
+    """
+    Make sure there is a partition for this month and each of the next
+    `months_ahead` months. Returns the months that were created.
+    """
+    this_month = (today or date.today()).replace(day=1)
+    existing = set(partitions())
+    created = []
+
+    with connection.cursor() as cursor:
+        for n in range(months_ahead + 1):
+            month = add_months(this_month, n)
+            if month not in existing:
+                _create_partition(cursor, month)
+                created.append(month)
+
+    return created
+
+
+def detach_partitions(
+    retain_months: int, drop: bool = False, today: date | None = None
+) -> list[date]:
+    """
+    Detach partitions that only contain audit logs from before the last
+    `retain_months` months, and optionally drop them.
+    Returns the months that were detached.
+    """
+    cutoff = add_months((today or date.today()).replace(day=1), -retain_months)
+    qn = connection.ops.quote_name
+    detached = []
+
+    with connection.cursor() as cursor:
+        for month in partitions():
+            if month >= cutoff:
+                continue
+
+            name = partition_name(month)
+            cursor.execute(f"ALTER TABLE {qn(TABLE)} DETACH PARTITION {qn(name)}")
+            if drop:
+                cursor.execute(f"DROP TABLE {qn(name)}")
+            detached.append(month)
+
+    return detached
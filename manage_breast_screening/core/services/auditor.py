@@ -1,9 +1,16 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.core import serializers
+from django.db import transaction
+from django.utils.encoding import is_protected_type
 
 from ..models import AuditLog
 
+_deferred_logs = ContextVar("deferred_audit_logs", default=None)
+
 
 class AnonymousAuditError(ValueError):
     pass
@@ -13,24 +20,71 @@ class AuditAfterDeleteError(Exception):
     pass
 
 
+@cache
+def _snapshot_fields(model, excluded_fields):
+    """
+    The fields of a model to include in a snapshot.
+
+    This matches the fields that the "python" serializer would output, when
+    restricted to the fields not in `excluded_fields`.
+    """
+    included = {
+        field.name for field in model._meta.fields if field.name not in excluded_fields
+    }
+    return tuple(
+        field
+        for field in model._meta.concrete_model._meta.local_fields
+        if field.serialize and field.name in included
+    )
+
+
 def make_snapshot(obj):
     """
     Turn a model object into a python dictionary that can be stored in a JSON field
+
+    Values are converted in the same way as `serializers.serialize("python", ...)`, but
+    without the overhead of setting up a serializer for every object.
+    """
+    snapshot = {}
+    for field in _snapshot_fields(type(obj), tuple(settings.AUDIT_EXCLUDED_FIELDS)):
+        value = field.value_from_object(obj)
+        snapshot[field.name] = (
+            value if is_protected_type(value) else field.value_to_string(obj)
+        )
+    return snapshot
+
+
+@contextmanager
+def deferred_audit(using=None):
+    """
+    Run the block in a transaction, and buffer any audit logs created inside it
+    rather than writing them straight away.
+
+    The buffered logs are written in a single query at the end of the block, as
+    the last statement of the transaction, so they are committed or rolled back
+    together with the audited changes. Until then, the AuditLog objects returned
+    by the Auditor are unsaved.
+
+    Can also be used as a view decorator.
     """
-    fields = [
-        field.name
-        for field in obj._meta.fields
-        if field.name not in settings.AUDIT_EXCLUDED_FIELDS
-    ]
-    snapshot = serializers.serialize("python", [obj], fields=fields)[0]
-    return snapshot["fields"]
+    log_entry_list = []
+    token = _deferred_logs.set(log_entry_list)
+    try:
+        with transaction.atomic(using=using):
+            yield
+            if log_entry_list:
+                AuditLog.objects.using(using).bulk_create(
+                    log_entry_list, batch_size=settings.AUDIT_BATCH_SIZE
+                )
+    finally:
+        _deferred_logs.reset(token)
 
 
 def _log_action(object, operation, actor, system_update_id):
     """
     Create an audit record from a model instance
     """
-    return AuditLog.objects.create(
+    log_entry = AuditLog(
         content_type=ContentType.objects.get_for_model(object),
         object_id=object.pk,
         operation=operation,
@@ -41,25 +95,50 @@ def _log_action(object, operation, actor, system_update_id):
         system_update_id=system_update_id,
     )
 
+    deferred = _deferred_logs.get()
+    if deferred is not None:
+        deferred.append(log_entry)
+    else:
+        log_entry.save()
+
+    return log_entry
 
-def _log_actions(objects, operation, actor, system_update_id):
+
+def _log_actions(objects, operation, actor, system_update_id, batch_size=None):
     """
     Create audit records from a queryset or list of model instances
     """
-    log_entry_list = [
-        AuditLog(
-            content_type=ContentType.objects.get_for_model(object),
-            object_id=object.pk,
-            operation=operation,
-            snapshot=(
-                {} if operation == AuditLog.Operations.DELETE else make_snapshot(object)
-            ),
-            actor=actor,
-            system_update_id=system_update_id,
+    content_types = {}
+    log_entry_list = []
+
+    for object in objects:
+        model = type(object)
+        if model not in content_types:
+            content_types[model] = ContentType.objects.get_for_model(object)
+
+        log_entry_list.append(
+            AuditLog(
+                content_type=content_types[model],
+                object_id=object.pk,
+                operation=operation,
+                snapshot=(
+                    {}
+                    if operation == AuditLog.Operations.DELETE
+                    else make_snapshot(object)
+                ),
+                actor=actor,
+                system_update_id=system_update_id,
+            )
         )
-        for object in objects
-    ]
-    AuditLog.objects.bulk_create(log_entry_list)
+
+    deferred = _deferred_logs.get()
+    if deferred is not None:
+        deferred.extend(log_entry_list)
+    else:
+        AuditLog.objects.bulk_create(
+            log_entry_list, batch_size=batch_size or settings.AUDIT_BATCH_SIZE
+        )
+
     return log_entry_list
 
 
@@ -106,26 +185,29 @@ class Auditor:
             system_update_id=self.system_update_id,
         )
 
-    def audit_bulk_create(self, objects) -> list[AuditLog]:
+    def audit_bulk_create(self, objects, batch_size=None) -> list[AuditLog]:
         return _log_actions(
             objects=objects,
             operation=AuditLog.Operations.CREATE,
             actor=self.actor,
             system_update_id=self.system_update_id,
+            batch_size=batch_size,
         )
 
-    def audit_bulk_update(self, objects) -> list[AuditLog]:
+    def audit_bulk_update(self, objects, batch_size=None) -> list[AuditLog]:
         return _log_actions(
             objects=objects,
             operation=AuditLog.Operations.UPDATE,
             actor=self.actor,
             system_update_id=self.system_update_id,
+            batch_size=batch_size,
         )
 
-    def audit_bulk_delete(self, objects) -> list[AuditLog]:
+    def audit_bulk_delete(self, objects, batch_size=None) -> list[AuditLog]:
         return _log_actions(
             objects=objects,
             operation=AuditLog.Operations.DELETE,
             actor=self.actor,
             system_update_id=self.system_update_id,
+            batch_size=batch_size,
         )
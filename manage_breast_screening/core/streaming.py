@@ -0,0 +1,44 @@
+"""
+Stream rendered Jinja templates to the browser as they are generated, rather
+than rendering the whole page into a string first.
+"""
+
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template import engines
+from django.template.backends.utils import csrf_input_lazy, csrf_token_lazy
+
+# Number of pieces of output to group together into each chunk that is sent
+BUFFER_SIZE = 50
+
+
+def render_streaming(request, template_name, context=None, status=None):
+    """
+    Like django.shortcuts.render, but streams the response.
+
+    The first chunks of the page, such as the header and navigation, reach the
+    browser while the rest is still rendering. This improves the time to first
+    byte, but doesn't bound memory use: the context is built before anything is
+    sent, and macros such as `table` still render their whole output at once.
+
+    Because the status and headers are sent first, an error part way through
+    rendering results in a truncated page rather than an error page.
+    """
+    backend = engines["jinja2"]
+    template = backend.get_template(template_name).template
+
+    context = dict(context or {})
+    context["request"] = request
+    context["csrf_input"] = csrf_input_lazy(request)
+    context["csrf_token"] = csrf_token_lazy(request)
+    for context_processor in backend.template_context_processors:
+        context.update(context_processor(request))
+
+    # The CSRF cookie is set when the response passes back through the
+    # middleware, which happens before the template uses the token
+    get_token(request)
+
+    stream = template.stream(context)
+    stream.enable_buffering(BUFFER_SIZE)
+
+    return StreamingHttpResponse(stream, status=status)
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from manage_breast_screening.core.models import AuditLog
+from manage_breast_screening.core.services.audit_history import (
+    AuditHistory,
+    InvalidCursorError,
+)
+from manage_breast_screening.core.services.auditor import Auditor
+from manage_breast_screening.participants.tests.factories import ParticipantFactory
+
+from ..factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestAuditHistory:
+    @pytest.fixture
+    def participant(self):
+        return ParticipantFactory.create()
+
+    @pytest.fixture
+    def logs(self, participant):
+        """
+        Five updates to the participant, an hour apart, with the last two
+        sharing a timestamp. Newest first.
+        """
+        auditor = Auditor(system_update_id="test")
+        logs = [auditor.audit_update(participant) for _ in range(5)]
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i, log in enumerate(logs):
+            log.created_at = start + timedelta(hours=min(i, 3))
+        AuditLog.objects.bulk_update(logs, ["created_at"])
+
+        return sorted(logs, key=lambda log: (log.created_at, log.pk), reverse=True)
+
+    def test_pages_through_an_objects_history(self, participant, logs):
+        Auditor(system_update_id="test").audit_create(ParticipantFactory.create())
+        history = AuditHistory.for_object(participant)
+
+        first = history.page(limit=2)
+        second = history.page(first.next_cursor, limit=2)
+        third = history.page(second.next_cursor, limit=2)
+
+        assert first.logs == logs[:2]
+        assert second.logs == logs[2:4]
+        assert third.logs == logs[4:]
+        assert third.next_cursor is None
+
+    def test_iterating_streams_every_page(
+        self, participant, logs, django_assert_num_queries
+    ):
+        history = AuditHistory.for_object(participant)
+        history.PAGE_SIZE = 2
+
+        with django_assert_num_queries(3):
+            assert list(history) == logs
+
+    def test_for_system_update(self, logs):
+        assert AuditHistory.for_system_update("test").page().logs == logs
+        assert AuditHistory.for_system_update("other").page().logs == []
+
+    def test_for_actor(self, participant):
+        user = UserFactory.create()
+        log = Auditor(actor=user).audit_update(participant)
+
+        assert AuditHistory.for_actor(user).page().logs == [log]
+
+    def test_invalid_cursor(self, participant):
+        with pytest.raises(InvalidCursorError):
+            AuditHistory.for_object(participant).page("abc")
@@ -0,0 +1,155 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from manage_breast_screening.core.models import AuditLog
+from manage_breast_screening.core.services import audit_log_partitions
+from manage_breast_screening.core.services.auditor import Auditor
+from manage_breast_screening.participants.tests.factories import ParticipantFactory
+
+
+def test_add_months():
+    assert audit_log_partitions.add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert audit_log_partitions.add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+
+@pytest.mark.django_db
+class TestAuditLogPartitions:
+    @pytest.fixture
+    def existing_log(self):
+        log = Auditor(system_update_id="test").audit_create(ParticipantFactory.create())
+        AuditLog.objects.filter(pk=log.pk).update(
+            created_at=datetime(2025, 11, 15, tzinfo=timezone.utc)
+        )
+        return log
+
+    def test_convert_to_partitioned(self, existing_log):
+        assert not audit_log_partitions.is_partitioned()
+
+        audit_log_partitions.convert_to_partitioned(
+            months_ahead=1, today=date(2026, 1, 20)
+        )
+
+        assert audit_log_partitions.is_partitioned()
+        assert audit_log_partitions.partitions() == [
+            date(2025, 11, 1),
+            date(2025, 12, 1),
+            date(2026, 1, 1),
+            date(2026, 2, 1),
+        ]
+        assert AuditLog.objects.get().pk == existing_log.pk
+
+        log = Auditor(system_update_id="test").audit_create(ParticipantFactory.create())
+        assert AuditLog.objects.filter(pk=log.pk).exists()
+
+    def test_convert_to_partitioned_keeps_unique_constraints(self, existing_log):
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(
+                f"""
+                ALTER TABLE {audit_log_partitions.TABLE} ADD CONSTRAINT test_unique
+                UNIQUE (object_id, operation, created_at)
+                """
+            )
+
+        audit_log_partitions.convert_to_partitioned(
+            months_ahead=0, today=date(2026, 1, 20)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT contype FROM pg_constraint WHERE conname = 'test_unique' "
+                "AND conrelid = %s::regclass",
+                [audit_log_partitions.TABLE],
+            )
+            assert cursor.fetchall() == [("u",)]
+
+    def test_convert_to_partitioned_outside_the_public_schema(self, existing_log):
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute('CREATE SCHEMA "Audit"')
+            cursor.execute(
+                f'ALTER TABLE {audit_log_partitions.TABLE} SET SCHEMA "Audit"'
+            )
+            cursor.execute('SET LOCAL search_path TO "Audit", public')
+
+        audit_log_partitions.convert_to_partitioned(
+            months_ahead=0, today=date(2026, 1, 20)
+        )
+
+        assert audit_log_partitions.is_partitioned()
+        assert AuditLog.objects.get().pk == existing_log.pk
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_indexes WHERE schemaname = 'Audit' "
+                "AND tablename = %s",
+                [audit_log_partitions.TABLE],
+            )
+            # the primary key and the indexes copied from the old table
+            assert cursor.fetchone()[0] > 1
+
+    def test_create_partitions_moves_rows_out_of_the_default_partition(
+        self, existing_log
+    ):
+        audit_log_partitions.convert_to_partitioned(
+            months_ahead=0, today=date(2025, 11, 1)
+        )
+        AuditLog.objects.filter(pk=existing_log.pk).update(
+            created_at=datetime(2026, 1, 5, tzinfo=timezone.utc)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT count(*) FROM {audit_log_partitions.DEFAULT_PARTITION}"
+            )
+            assert cursor.fetchone()[0] == 1
+
+        created = audit_log_partitions.create_partitions(
+            months_ahead=0, today=date(2026, 1, 20)
+        )
+        assert created == [date(2026, 1, 1)]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT count(*) FROM {audit_log_partitions.DEFAULT_PARTITION}"
+            )
+            assert cursor.fetchone()[0] == 0
+            cursor.execute(
+                f"SELECT id FROM {audit_log_partitions.partition_name(date(2026, 1, 1))}"
+            )
+            assert cursor.fetchall() == [(existing_log.pk,)]
+
+        assert AuditLog.objects.get().pk == existing_log.pk
+
+    def test_create_and_detach_partitions(self, existing_log):
+        audit_log_partitions.convert_to_partitioned(
+            months_ahead=0, today=date(2025, 11, 1)
+        )
+
+        created = audit_log_partitions.create_partitions(
+            months_ahead=1, today=date(2026, 1, 20)
+        )
+        assert created == [date(2026, 1, 1), date(2026, 2, 1)]
+
+        detached = audit_log_partitions.detach_partitions(
+            retain_months=1, today=date(2026, 1, 20)
+        )
+        assert detached == [date(2025, 11, 1)]
+        assert audit_log_partitions.partitions() == [
+            date(2026, 1, 1),
+            date(2026, 2, 1),
+        ]
+        assert not AuditLog.objects.exists()
+
+    def test_command_requires_a_partitioned_table(self):
+        with pytest.raises(Exception, match="--convert"):
+            call_command("manage_audit_log_partitions")
+
+    def test_command(self, capsys):
+        call_command("manage_audit_log_partitions", "--convert", "--months-ahead=2")
+
+        assert audit_log_partitions.is_partitioned()
+        assert len(audit_log_partitions.partitions()) == 3
+        assert "Converted" in capsys.readouterr().out
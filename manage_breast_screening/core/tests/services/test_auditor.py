@@ -1,9 +1,23 @@
+from unittest import mock
+
 import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
+from django.db import DatabaseError, connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 
-from manage_breast_screening.core.services.auditor import Auditor
-from manage_breast_screening.participants.models import Participant
-from manage_breast_screening.participants.tests.factories import ParticipantFactory
+from manage_breast_screening.core.models import AuditLog
+from manage_breast_screening.core.services.auditor import (
+    Auditor,
+    deferred_audit,
+    make_snapshot,
+)
+from manage_breast_screening.participants.models import Appointment, Participant
+from manage_breast_screening.participants.tests.factories import (
+    AppointmentFactory,
+    ParticipantFactory,
+)
 
 from ..factories import UserFactory
 
@@ -159,6 +173,17 @@ class TestAuditor:
         assert logs[0].snapshot == {}
         assert logs[1].snapshot == {}
 
+    def test_audit_bulk_create_in_batches(self, django_assert_num_queries):
+        auditor = Auditor(system_update_id="test")
+        participants = ParticipantFactory.create_batch(5)
+
+        # content types are cached, so there should be one query per batch
+        ContentType.objects.get_for_model(Participant)
+        with django_assert_num_queries(3):
+            logs = auditor.audit_bulk_create(participants, batch_size=2)
+
+        assert [log.object_id for log in logs] == [p.pk for p in participants]
+
     def test_from_request(self):
         user = UserFactory.create()
         request = RequestFactory().get("/clinics")
@@ -167,3 +192,78 @@ class TestAuditor:
         auditor = Auditor.from_request(request)
         log = auditor.audit_create(user)
         assert log.actor == user
+
+
+@pytest.mark.django_db
+class TestDeferredAudit:
+    def test_logs_are_written_together_at_the_end_of_the_block(self):
+        auditor = Auditor(system_update_id="test")
+        a, b, c = ParticipantFactory.create_batch(3)
+        ContentType.objects.get_for_model(Participant)
+
+        with CaptureQueriesContext(connection) as queries:
+            with deferred_audit():
+                auditor.audit_create(a)
+                auditor.audit_update(b)
+                auditor.audit_bulk_create([c])
+
+                assert not AuditLog.objects.exists()
+
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+        assert sorted(AuditLog.objects.values_list("object_id", "operation")) == sorted(
+            [(a.pk, "create"), (b.pk, "update"), (c.pk, "create")]
+        )
+
+    def test_logs_are_discarded_on_rollback(self):
+        auditor = Auditor(system_update_id="test")
+        participant = ParticipantFactory.create()
+
+        with pytest.raises(RuntimeError):
+            with deferred_audit():
+                auditor.audit_create(participant)
+                raise RuntimeError
+
+        assert not AuditLog.objects.exists()
+
+    def test_changes_are_rolled_back_if_the_logs_cannot_be_written(self):
+        auditor = Auditor(system_update_id="test")
+
+        with mock.patch(
+            "django.db.models.QuerySet.bulk_create", side_effect=DatabaseError
+        ):
+            with pytest.raises(DatabaseError):
+                with deferred_audit():
+                    participant = ParticipantFactory.create()
+                    auditor.audit_create(participant)
+
+        assert not Participant.objects.filter(pk=participant.pk).exists()
+        assert not AuditLog.objects.exists()
+
+    def test_logs_are_written_immediately_outside_the_block(self):
+        auditor = Auditor(system_update_id="test")
+
+        with deferred_audit():
+            pass
+
+        log = auditor.audit_create(ParticipantFactory.create())
+        assert AuditLog.objects.filter(pk=log.pk).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "factory,model",
+    [(ParticipantFactory, Participant), (AppointmentFactory, Appointment)],
+)
+def test_make_snapshot_matches_python_serializer(settings, factory, model):
+    obj = model.objects.get(pk=factory.create().pk)
+    fields = [
+        field.name
+        for field in model._meta.fields
+        if field.name not in settings.AUDIT_EXCLUDED_FIELDS
+    ]
+
+    assert (
+        make_snapshot(obj)
+        == serializers.serialize("python", [obj], fields=fields)[0]["fields"]
+    )
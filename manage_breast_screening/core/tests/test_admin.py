@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+import pytest
+import time_machine
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+
+from manage_breast_screening.participants.tests.factories import ParticipantFactory
+
+from ..models import AuditLog
+from ..services.audit_history import AuditHistory
+from ..services.auditor import Auditor
+from .factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestAuditLogAdmin:
+    @pytest.fixture
+    def admin_client(self, client):
+        client.force_login(UserFactory.create(is_staff=True, is_superuser=True))
+        return client
+
+    @time_machine.travel("2026-01-20 10:00")
+    def test_changelist_defaults_to_the_current_month(self, admin_client):
+        response = admin_client.get(reverse("admin:core_auditlog_changelist"))
+
+        assert response.status_code == 302
+        assert response.url.endswith("?created_at__year=2026&created_at__month=1")
+
+    def test_changelist_filtered_by_date(self, admin_client):
+        response = admin_client.get(
+            reverse("admin:core_auditlog_changelist"),
+            {"created_at__year": 2026, "created_at__month": 1},
+        )
+
+        assert response.status_code == 200
+
+    @time_machine.travel("2026-01-20 10:00")
+    def test_changelist_all_dates(self, admin_client):
+        url = reverse("admin:core_auditlog_changelist")
+
+        response = admin_client.get(url, {"created_at__year": 2026})
+        assert response.status_code == 200
+        assert 'href="?all_dates=1" class="date-back"' in response.content.decode()
+
+        response = admin_client.get(url, {"all_dates": 1})
+        assert response.status_code == 200
+
+        response = admin_client.get(url, {"all_dates": 1, "operation": "create"})
+        assert response.status_code == 200
+
+    def test_audit_history(self, admin_client):
+        participant = ParticipantFactory.create()
+        auditor = Auditor(system_update_id="test")
+        logs = [auditor.audit_update(participant) for _ in range(3)]
+        content_type = ContentType.objects.get_for_model(participant)
+        url = reverse("admin:core_auditlog_audit_history")
+
+        with patch.object(AuditHistory, "PAGE_SIZE", 2):
+            response = admin_client.get(
+                url, {"content_type": content_type.pk, "object_id": participant.pk}
+            )
+            assert response.status_code == 200
+            assert len(response.context_data["page"].logs) == 2
+            assert response.context_data["next_url"]
+
+            response = admin_client.get(response.context_data["next_url"])
+            assert response.status_code == 200
+            assert len(response.context_data["page"].logs) == 1
+            assert response.context_data["next_url"] is None
+
+        assert AuditLog.objects.count() == len(logs)
+
+    def test_audit_history_requires_a_subject(self, admin_client):
+        response = admin_client.get(reverse("admin:core_auditlog_audit_history"))
+
+        assert response.status_code == 400
@@ -0,0 +1,28 @@
+from copy import deepcopy
+
+import pytest
+from django.core.management import CommandError, call_command
+
+
+@pytest.fixture
+def bytecode_cache_dir(settings, tmp_path):
+    settings.JINJA2_BYTECODE_CACHE_DIR = str(tmp_path)
+
+    # Changing TEMPLATES makes Django recreate the template engines, so that they
+    # pick up the setting, and recreate them again when it is restored
+    settings.TEMPLATES = deepcopy(settings.TEMPLATES)
+
+
+@pytest.mark.usefixtures("bytecode_cache_dir")
+def test_compiles_templates_into_the_bytecode_cache(tmp_path, capsys):
+    call_command("compile_templates")
+
+    assert "Compiled" in capsys.readouterr().out
+    assert len(list(tmp_path.iterdir())) > 100
+
+
+def test_requires_a_bytecode_cache_dir(settings):
+    assert settings.JINJA2_BYTECODE_CACHE_DIR is None
+
+    with pytest.raises(CommandError):
+        call_command("compile_templates")
@@ -0,0 +1,156 @@
+import json
+import logging
+import uuid
+
+import pytest
+from django.template.loader import render_to_string
+from django.urls import reverse
+
+from manage_breast_screening.clinics.models import Clinic
+from manage_breast_screening.clinics.tests.factories import (
+    ClinicFactory,
+    ClinicSlotFactory,
+)
+
+from ..request_metrics import record_metrics
+
+
+@pytest.mark.django_db
+class TestRecordMetrics:
+    def test_counts_queries(self):
+        with record_metrics() as metrics:
+            Clinic.objects.count()
+            Clinic.objects.filter(pk=uuid.uuid4()).first()
+
+        assert metrics.query_count == 2
+        assert metrics.db_seconds > 0
+        assert metrics.view_seconds >= metrics.db_seconds
+
+    def test_times_template_rendering(self):
+        with record_metrics() as metrics:
+            render_to_string("components/count/template.jinja", {"params": {}})
+
+        assert metrics.template_seconds > 0
+
+    def test_no_warnings(self):
+        with record_metrics() as metrics:
+            Clinic.objects.count()
+
+        assert metrics.warnings() == []
+
+    def test_duplicate_queries(self, settings):
+        settings.REQUEST_METRICS_MAX_DUPLICATE_QUERIES = 2
+
+        with record_metrics() as metrics:
+            for _ in range(3):
+                Clinic.objects.filter(pk=uuid.uuid4()).first()
+
+        assert metrics.warnings() == ["duplicate_queries"]
+        sql, count = metrics.most_duplicated_query
+        assert sql.startswith("SELECT")
+        assert count == 3
+
+    def test_too_many_queries(self, settings):
+        settings.REQUEST_METRICS_MAX_QUERIES = 1
+
+        with record_metrics() as metrics:
+            Clinic.objects.count()
+            Clinic.objects.exists()
+
+        assert metrics.warnings() == ["too_many_queries"]
+
+    def test_slow_request(self, settings):
+        settings.REQUEST_METRICS_SLOW_REQUEST_MS = -1
+
+        with record_metrics() as metrics:
+            pass
+
+        assert metrics.warnings() == ["slow_request"]
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    def test_server_timing_header(self, client, settings):
+        settings.REQUEST_METRICS_SERVER_TIMING = True
+        ClinicFactory.create()
+
+        response = client.get(reverse("clinics:index_all"))
+
+        server_timing = response["Server-Timing"]
+        assert server_timing.startswith("db;dur=")
+        assert 'desc="3 queries"' in server_timing
+        assert "template;dur=" in server_timing
+        assert "view;dur=" in server_timing
+
+    def test_server_timing_header_disabled(self, client, settings):
+        settings.REQUEST_METRICS_SERVER_TIMING = False
+
+        response = client.get(reverse("clinics:index"))
+
+        assert "Server-Timing" not in response
+
+    def test_logs_summary(self, client, caplog):
+        ClinicFactory.create()
+
+        with caplog.at_level(
+            logging.INFO, logger="manage_breast_screening.core.request_metrics"
+        ):
+            client.get(reverse("clinics:index_all"))
+
+        [record] = [
+            record
+            for record in caplog.records
+            if record.name.endswith("request_metrics")
+        ]
+        summary = json.loads(record.getMessage())
+        assert record.levelno == logging.INFO
+        assert summary["method"] == "GET"
+        assert summary["path"] == reverse("clinics:index_all")
+        assert summary["status"] == 200
+        assert summary["queries"] == 3
+        assert "warnings" not in summary
+
+    def test_logs_warnings(self, client, caplog, settings):
+        settings.REQUEST_METRICS_MAX_QUERIES = 1
+
+        with caplog.at_level(
+            logging.INFO, logger="manage_breast_screening.core.request_metrics"
+        ):
+            client.get(reverse("clinics:index"))
+
+        [record] = [
+            record
+            for record in caplog.records
+            if record.name.endswith("request_metrics")
+        ]
+        assert record.levelno == logging.WARNING
+        assert json.loads(record.getMessage())["warnings"] == ["too_many_queries"]
+
+    def test_logs_streaming_responses_once_they_are_sent(
+        self, client, caplog, settings
+    ):
+        settings.STREAMING_RESPONSES = True
+        clinic = ClinicFactory.create()
+        ClinicSlotFactory.create_batch(3, clinic=clinic)
+
+        with caplog.at_level(
+            logging.INFO, logger="manage_breast_screening.core.request_metrics"
+        ):
+            response = client.get(reverse("clinics:show", kwargs={"id": clinic.pk}))
+            assert response.streaming
+            assert not [
+                record
+                for record in caplog.records
+                if record.name.endswith("request_metrics")
+            ]
+
+            b"".join(response.streaming_content)
+
+        [record] = [
+            record
+            for record in caplog.records
+            if record.name.endswith("request_metrics")
+        ]
+        summary = json.loads(record.getMessage())
+        assert summary["template_ms"] > 0
+        assert 0 < summary["first_byte_ms"] <= summary["view_ms"]
@@ -5,10 +5,37 @@ https://service-manual.nhs.uk/content/numbers-measurements-dates-time
 """
 
 from datetime import date, datetime
+from functools import lru_cache, wraps
 
 from dateutil.relativedelta import relativedelta
 
+# Number of formatted values to remember for each function. Pages tend to show
+# the same few dates and times many times over.
+CACHE_SIZE = 1024
 
+
+def _memoise(func):
+    """
+    Cache the formatted value for each input.
+
+    Aware datetimes for the same instant are equal even if their local times
+    differ, so the UTC offset is part of the key.
+    """
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def cached(value, utcoffset):
+        return func(value)
+
+    @wraps(func)
+    def wrapper(value):
+        utcoffset = value.utcoffset() if hasattr(value, "utcoffset") else None
+        return cached(value, utcoffset)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoise
 def format_date(value):
     """
     Format a date
@@ -27,7 +54,12 @@ def format_relative_date(value: datetime | date):
     if isinstance(value, datetime):
         value = value.date()
 
-    today = date.today()
+    return _format_relative_date(value, date.today())
+
+
+# Today is part of the key, so nothing cached is used after midnight
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_relative_date(value: date, today: date):
     days = (value - today).days
 
     amount = _format_date_difference(value, today)
@@ -71,6 +103,7 @@ def format_date_time(value):
     return f"{date_part}, {time_part}"
 
 
+@_memoise
 def format_time(value):
     """
     Format a time on a 12-hour clock, with special cases for midday and midnight.
@@ -0,0 +1,27 @@
+"""
+Datetime ranges for filtering datetime columns by date.
+
+A `__date` lookup converts every value in the column to a date in the current
+time zone before comparing it, so the database can't use an index on the
+column. Comparing the column with the bounds of the day instead can.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+
+def start_of_day(day: date) -> datetime:
+    """
+    Midnight at the start of `day` in the current time zone
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def day_range(day: date | None = None) -> tuple[datetime, datetime]:
+    """
+    The half-open range [start, end) of datetimes on `day`, or today if no day is
+    given, in the current time zone.
+    """
+    day = day or timezone.localdate()
+    return start_of_day(day), start_of_day(day + timedelta(days=1))
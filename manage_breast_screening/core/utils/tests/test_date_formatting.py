@@ -1,10 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
 import pytest
 import time_machine
 
-from ..date_formatting import format_relative_date
+from ..date_formatting import format_date_time, format_relative_date
 
 
 @time_machine.travel(datetime(2025, 5, 2, 10, tzinfo=ZoneInfo("Europe/London")))
@@ -25,3 +25,21 @@ from ..date_formatting import format_relative_date
 )
 def test_relative_dates(dateiso, output):
     assert format_relative_date(datetime.fromisoformat(dateiso)) == output
+
+
+def test_format_date_time_uses_the_local_time_of_each_value():
+    utc = datetime(2025, 5, 1, 23, 30, tzinfo=ZoneInfo("UTC"))
+    london = utc.astimezone(ZoneInfo("Europe/London"))
+
+    assert format_date_time(utc) == "1 May 2025, 11:30pm"
+    assert format_date_time(london) == "2 May 2025, 12:30am"
+
+
+def test_format_relative_date_changes_at_midnight():
+    value = date(2025, 5, 2)
+
+    with time_machine.travel(datetime(2025, 5, 2, 23, 59), tick=False):
+        assert format_relative_date(value) == "today"
+
+    with time_machine.travel(datetime(2025, 5, 3, 0, 1), tick=False):
+        assert format_relative_date(value) == "yesterday"
@@ -0,0 +1,33 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import time_machine
+from django.utils import timezone
+
+from ..date_ranges import day_range
+
+LONDON = ZoneInfo("Europe/London")
+
+
+def test_day_range():
+    with timezone.override(LONDON):
+        start, end = day_range(date(2025, 6, 1))
+
+    assert start == datetime(2025, 6, 1, tzinfo=LONDON)
+    assert end == datetime(2025, 6, 2, tzinfo=LONDON)
+
+
+def test_day_range_when_the_clocks_change():
+    with timezone.override(LONDON):
+        start, end = day_range(date(2025, 3, 30))
+
+    # datetimes in the same time zone are subtracted as wall clock times
+    assert end.timestamp() - start.timestamp() == timedelta(hours=23).total_seconds()
+
+
+@time_machine.travel(datetime(2025, 6, 1, 23, 30, tzinfo=ZoneInfo("UTC")))
+def test_today_in_the_current_time_zone():
+    with timezone.override(LONDON):
+        start, _ = day_range()
+
+    assert start == datetime(2025, 6, 2, tzinfo=LONDON)
@@ -0,0 +1,47 @@
+from uuid import uuid4
+
+import pytest
+from django.urls import NoReverseMatch, reverse, set_script_prefix
+
+from ..urls import cached_reverse
+
+
+@pytest.mark.parametrize(
+    ("viewname", "kwargs"),
+    [
+        ("clinics:index", None),
+        ("clinics:show", {"id": uuid4()}),
+        ("clinics:check_in", {"id": uuid4(), "appointment_id": uuid4()}),
+        ("mammograms:start_screening", {"id": uuid4()}),
+    ],
+)
+def test_matches_reverse(viewname, kwargs):
+    assert cached_reverse(viewname, kwargs=kwargs) == reverse(viewname, kwargs=kwargs)
+    assert cached_reverse(viewname, kwargs=kwargs) == reverse(viewname, kwargs=kwargs)
+
+
+def test_falls_back_to_reverse_for_other_arguments():
+    id = uuid4()
+
+    assert cached_reverse("clinics:show", kwargs={"id": str(id)}) == reverse(
+        "clinics:show", kwargs={"id": id}
+    )
+    assert cached_reverse("clinics:show", args=[id]) == reverse(
+        "clinics:show", args=[id]
+    )
+
+
+def test_invalid_arguments():
+    with pytest.raises(NoReverseMatch):
+        cached_reverse("clinics:show", kwargs={"appointment_id": uuid4()})
+
+
+def test_includes_the_script_prefix():
+    id = uuid4()
+    set_script_prefix("/prefix/")
+    try:
+        assert cached_reverse("clinics:show", kwargs={"id": id}) == (
+            f"/prefix/clinics/{id}/"
+        )
+    finally:
+        set_script_prefix("/")
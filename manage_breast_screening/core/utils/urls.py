@@ -0,0 +1,61 @@
+import re
+from functools import cache
+from uuid import UUID
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import NoReverseMatch, get_script_prefix, reverse
+
+
+def cached_reverse(viewname, args=None, kwargs=None, **options):
+    """
+    A faster `django.urls.reverse` for URLs whose arguments are all UUIDs.
+
+    The URL pattern for each view name is reversed once, with placeholder UUIDs,
+    and the actual UUIDs are substituted into it for each call. Anything else is
+    passed through to `reverse`.
+
+    >>> cached_reverse("clinics:show", kwargs={"id": UUID(int=1)})
+    '/clinics/00000000-0000-0000-0000-000000000001/'
+    """
+    kwargs = kwargs or {}
+
+    if args or options or not all(isinstance(v, UUID) for v in kwargs.values()):
+        return reverse(viewname, args=args, kwargs=kwargs, **options)
+
+    parts = _url_parts(viewname, tuple(sorted(kwargs)), get_script_prefix())
+    if parts is None:
+        return reverse(viewname, kwargs=kwargs)
+
+    return "".join(part if name is None else str(kwargs[name]) for part, name in parts)
+
+
+@cache
+def _url_parts(viewname, names, script_prefix):
+    """
+    Split the URL into literal strings and the names of the arguments between them
+    """
+    placeholders = {name: str(UUID(int=i + 1)) for i, name in enumerate(names)}
+    try:
+        url = reverse(viewname, kwargs=placeholders)
+    except NoReverseMatch:
+        return None
+
+    if not placeholders:
+        return [(url, None)]
+
+    names_by_placeholder = {value: name for name, value in placeholders.items()}
+    parts = []
+    for piece in re.split(f"({'|'.join(placeholders.values())})", url):
+        if piece in names_by_placeholder:
+            parts.append((None, names_by_placeholder[piece]))
+        elif piece:
+            parts.append((piece, None))
+
+    return parts
+
+
+@receiver(setting_changed)
+def _clear_url_parts(setting, **kwargs):
+    if setting == "ROOT_URLCONF":
+        _url_parts.cache_clear()
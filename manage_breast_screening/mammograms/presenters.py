@@ -1,8 +1,7 @@
 from functools import cached_property
 
-from django.urls import reverse
-
 from ..core.utils.date_formatting import format_date, format_relative_date, format_time
+from ..core.utils.urls import cached_reverse
 from ..participants.models import AppointmentStatus
 from ..participants.presenters import ParticipantPresenter, status_colour
 
@@ -15,7 +14,7 @@ def present_secondary_nav(id):
         {
             "id": "all",
             "text": "Appointment details",
-            "href": reverse("mammograms:start_screening", kwargs={"id": id}),
+            "href": cached_reverse("mammograms:start_screening", kwargs={"id": id}),
             "current": True,
         },
         {"id": "medical_information", "text": "Medical information", "href": "#"},
@@ -31,9 +30,7 @@ class AppointmentPresenter:
         self.allStatuses = AppointmentStatus
         self.id = appointment.id
         self.clinic_slot = ClinicSlotPresenter(appointment.clinic_slot)
-        self.participant = ParticipantPresenter(
-            appointment.screening_episode.participant
-        )
+        self.participant = ParticipantPresenter(appointment.participant)
 
     @cached_property
     def participant_url(self):
@@ -45,15 +42,16 @@ class AppointmentPresenter:
 
     @cached_property
     def current_status(self):
-        current_status = self._appointment.current_status
+        appointment = self._appointment
+        state = appointment.current_state or AppointmentStatus.CONFIRMED
 
-        colour = status_colour(current_status.state)
+        colour = status_colour(state)
 
         return {
             "classes": f"nhsuk-tag--{colour} app-nowrap" if colour else "app-nowrap",
-            "text": current_status.get_state_display(),
-            "key": current_status.state,
-            "is_confirmed": current_status.state == AppointmentStatus.CONFIRMED,
+            "text": appointment.get_current_state_display(),
+            "key": state,
+            "is_confirmed": state == AppointmentStatus.CONFIRMED,
         }
 
     @cached_property
@@ -77,9 +75,12 @@ class AppointmentPresenter:
 class ClinicSlotPresenter:
     def __init__(self, clinic_slot):
         self._clinic_slot = clinic_slot
-        self._clinic = clinic_slot.clinic
 
-        self.clinic_id = self._clinic.id
+        self.clinic_id = clinic_slot.clinic_id
+
+    @cached_property
+    def _clinic(self):
+        return self._clinic_slot.clinic
 
     @cached_property
     def clinic_type(self):
@@ -0,0 +1,54 @@
+from django.urls import reverse
+
+from manage_breast_screening.core.benchmark_setup import BenchmarkTestCase, Budget
+
+
+class TestWizardViewsBenchmark(BenchmarkTestCase):
+    def get(self, name):
+        return self.client.get(reverse(name, kwargs={"id": self.busy_appointment.pk}))
+
+    def post(self, name, data):
+        return self.client.post(
+            reverse(name, kwargs={"id": self.busy_appointment.pk}), data
+        )
+
+    def test_show_steps(self):
+        for name, queries in [
+            ("mammograms:start_screening", 2),
+            ("mammograms:ask_for_medical_information", 1),
+            ("mammograms:record_medical_information", 1),
+            ("mammograms:awaiting_images", 0),
+            ("mammograms:appointment_cannot_go_ahead", 1),
+        ]:
+            with self.subTest(name=name):
+                self.assertWithinBudget(
+                    name,
+                    lambda: self.get(name),
+                    Budget(queries=queries, seconds=0.25, peak_memory_kb=500),
+                )
+
+    def test_submit_steps(self):
+        for name, data, queries in [
+            ("mammograms:start_screening", {"decision": "continue"}, 1),
+            ("mammograms:ask_for_medical_information", {"decision": "yes"}, 1),
+            ("mammograms:record_medical_information", {"decision": "continue"}, 1),
+        ]:
+            with self.subTest(name=name):
+                self.assertWithinBudget(
+                    f"{name} (submit)",
+                    lambda: self.post(name, data),
+                    Budget(queries=queries, seconds=0.25, peak_memory_kb=500),
+                )
+
+    def test_check_in(self):
+        statuses = self.busy_appointment.statuses.count()
+
+        self.assertWithinBudget(
+            "mammograms:check_in (submit)",
+            lambda: self.post("mammograms:check_in", {}),
+            Budget(queries=5, seconds=0.25, peak_memory_kb=500),
+        )
+
+        # Each run is rolled back, so every run checks in the appointment afresh
+        # and none of the check-ins persist
+        self.assertEqual(self.busy_appointment.statuses.count(), statuses)
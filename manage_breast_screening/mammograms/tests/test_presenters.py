@@ -20,8 +20,8 @@ class TestAppointmentPresenter:
     @pytest.fixture
     def mock_appointment(self):
         mock = MagicMock(spec=Appointment)
-        mock.screening_episode.participant.nhs_number = "99900900829"
-        mock.screening_episode.participant.pk = uuid4()
+        mock.participant.nhs_number = "99900900829"
+        mock.participant.pk = uuid4()
         return mock
 
     @pytest.mark.parametrize(
@@ -59,7 +59,8 @@ class TestAppointmentPresenter:
         expected_key,
         expected_is_confirmed,
     ):
-        mock_appointment.current_status = AppointmentStatus(state=status)
+        mock_appointment.current_state = status
+        mock_appointment.get_current_state_display.return_value = expected_text
 
         result = AppointmentPresenter(mock_appointment).current_status
 
@@ -84,9 +85,7 @@ class TestAppointmentPresenter:
         }
 
     def test_participant_url(self, mock_appointment):
-        mock_appointment.screening_episode.participant.pk = UUID(
-            "ac1b68ec-06a4-40a0-a016-7108dffe4397"
-        )
+        mock_appointment.participant.pk = UUID("ac1b68ec-06a4-40a0-a016-7108dffe4397")
         result = AppointmentPresenter(mock_appointment)
         assert (
             result.participant_url
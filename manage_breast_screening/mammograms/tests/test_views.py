@@ -1,15 +1,41 @@
+from uuid import uuid4
+
 import pytest
+from django.http import Http404
 from django.urls import reverse
 from pytest_django.asserts import assertContains, assertRedirects
 
 from manage_breast_screening.participants.tests.factories import AppointmentFactory
 
+from ..views import load_appointment
+
 
 @pytest.fixture
 def appointment():
     return AppointmentFactory.create()
 
 
+@pytest.mark.django_db
+class TestLoadAppointment:
+    def test_loads_details_in_one_query(
+        self, rf, appointment, django_assert_num_queries
+    ):
+        request = rf.get("/")
+
+        with django_assert_num_queries(1):
+            loaded = load_appointment(request, appointment.pk)
+            assert loaded == appointment
+            assert loaded.clinic_slot.clinic == appointment.clinic_slot.clinic
+            assert loaded.participant == appointment.screening_episode.participant
+
+        with django_assert_num_queries(0):
+            assert load_appointment(request, appointment.pk) is loaded
+
+    def test_not_found(self, rf):
+        with pytest.raises(Http404):
+            load_appointment(rf.get("/"), uuid4())
+
+
 @pytest.mark.django_db
 class TestStartScreening:
     def test_appointment_continued(self, client, appointment):
@@ -5,7 +5,7 @@ from django.urls import reverse
 from django.views.decorators.http import require_http_methods
 from django.views.generic import FormView
 
-from ..participants.models import Appointment, AppointmentStatus, Participant
+from ..participants.models import Appointment, AppointmentStatus
 from .forms import (
     AppointmentCannotGoAheadForm,
     AskForMedicalInformationForm,
@@ -19,20 +19,28 @@ APPOINTMENT_CANNOT_PROCEED = "Appointment cannot proceed"
 logger = logging.getLogger(__name__)
 
 
+def load_appointment(request, id) -> Appointment:
+    """
+    Fetch an appointment with its slot, clinic, screening episode, participant and
+    address in a single query. The appointment is memoised on the request, so
+    loading it again while handling the same request doesn't query the database.
+    """
+    appointments = getattr(request, "_loaded_appointments", None)
+    if appointments is None:
+        appointments = request._loaded_appointments = {}
+
+    if id not in appointments:
+        appointments[id] = get_object_or_404(Appointment.objects.with_details(), pk=id)
+    return appointments[id]
+
+
 class BaseAppointmentForm(FormView):
     @property
     def appointment_id(self):
         return self.kwargs["id"]
 
     def get_appointment(self):
-        return get_object_or_404(
-            Appointment.objects.prefetch_related(
-                "clinic_slot",
-                "screening_episode__participant",
-                "screening_episode__participant__address",
-            ),
-            pk=self.appointment_id,
-        )
+        return load_appointment(self.request, self.appointment_id)
 
 
 class StartScreening(BaseAppointmentForm):
@@ -85,8 +93,8 @@ class AskForMedicalInformation(BaseAppointmentForm):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        id = self.kwargs["id"]
-        participant = Participant.objects.get(screeningepisode__appointment__id=id)
+        id = self.appointment_id
+        participant = self.get_appointment().participant
 
         context.update(
             {
@@ -123,10 +131,7 @@ class RecordMedicalInformation(BaseAppointmentForm):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        id = self.kwargs["id"]
-        participant = get_object_or_404(
-            Participant, screeningepisode__appointment__id=id
-        )
+        participant = self.get_appointment().participant
         context.update(
             {
                 "title": "Record medical information",
@@ -149,8 +154,8 @@ class RecordMedicalInformation(BaseAppointmentForm):
 
 
 def appointment_cannot_go_ahead(request, id):
-    appointment = get_object_or_404(Appointment, pk=id)
-    participant = appointment.screening_episode.participant
+    appointment = load_appointment(request, id)
+    participant = appointment.participant
 
     if request.method == "POST":
         form = AppointmentCannotGoAheadForm(request.POST, instance=appointment)
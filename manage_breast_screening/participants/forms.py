@@ -1,11 +1,11 @@
 from django import forms
 
-from .models import Ethnicity
+from .models import ETHNIC_BACKGROUND_CHOICES, Ethnicity
 
 
 class EthnicityForm(forms.Form):
     ethnic_background_choice = forms.ChoiceField(
-        choices=Ethnicity.ethnic_background_ids_with_display_names(),
+        choices=ETHNIC_BACKGROUND_CHOICES,
         required=True,
         error_messages={"required": "Select an ethnic background"},
     )
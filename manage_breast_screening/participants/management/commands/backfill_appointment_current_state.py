@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Appointment
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate each appointment's denormalised current_state "
+        "from its most recent AppointmentStatus"
+    )
+
+    def handle(self, *args, **options):
+        count = Appointment.objects.refresh_current_state()
+        self.stdout.write(f"Updated current_state for {count} appointments")
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:19
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_current_state(apps, schema_editor):
+    Appointment = apps.get_model("participants", "Appointment")
+    AppointmentStatus = apps.get_model("participants", "AppointmentStatus")
+    Appointment.objects.update(
+        current_state=Coalesce(
+            Subquery(
+                AppointmentStatus.objects.filter(appointment=OuterRef("pk"))
+                .order_by("-created_at")
+                .values("state")[:1]
+            ),
+            Value("CONFIRMED"),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('participants', '0015_rename_ethnic_background_participant_ethnic_background_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='current_state',
+            field=models.CharField(choices=[('CONFIRMED', 'Confirmed'), ('CANCELLED', 'Cancelled'), ('DID_NOT_ATTEND', 'Did not attend'), ('CHECKED_IN', 'Checked in'), ('SCREENED', 'Screened'), ('PARTIALLY_SCREENED', 'Partially screened'), ('ATTENDED_NOT_SCREENED', 'Attended not screened')], db_index=True, default='CONFIRMED', editable=False, max_length=50),
+        ),
+        migrations.RunPython(backfill_current_state, migrations.RunPython.noop),
+    ]
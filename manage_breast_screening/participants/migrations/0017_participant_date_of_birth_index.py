@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('participants', '0016_appointment_current_state'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='participant',
+            name='date_of_birth',
+            field=models.DateField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('participants', '0017_participant_date_of_birth_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointmentstatus',
+            index=models.Index(fields=['appointment', '-created_at'], include=('state', 'id'), name='appointmentstatus_latest_idx'),
+        ),
+    ]
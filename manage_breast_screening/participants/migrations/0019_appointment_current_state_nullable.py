@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:16
+
+from django.db import migrations, models
+
+
+def clear_current_state_without_statuses(apps, schema_editor):
+    Appointment = apps.get_model("participants", "Appointment")
+    Appointment.objects.filter(statuses__isnull=True).update(current_state=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('participants', '0018_appointmentstatus_latest_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='current_state',
+            field=models.CharField(choices=[('CONFIRMED', 'Confirmed'), ('CANCELLED', 'Cancelled'), ('DID_NOT_ATTEND', 'Did not attend'), ('CHECKED_IN', 'Checked in'), ('SCREENED', 'Screened'), ('PARTIALLY_SCREENED', 'Partially screened'), ('ATTENDED_NOT_SCREENED', 'Attended not screened')], db_index=True, editable=False, max_length=50, null=True),
+        ),
+        migrations.RunPython(
+            clear_current_state_without_statuses, migrations.RunPython.noop
+        ),
+    ]
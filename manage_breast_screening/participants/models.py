@@ -1,12 +1,27 @@
 import uuid
-from datetime import date
+from dataclasses import dataclass
+from datetime import date, datetime
 from logging import getLogger
+from types import MappingProxyType
 
+from dateutil.relativedelta import relativedelta
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
-from django.db.models import OuterRef, Subquery
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Lead, RowNumber
 
 from ..core.models import BaseModel
+from ..core.utils.date_ranges import day_range
 
 logger = getLogger(__name__)
 
@@ -71,40 +86,129 @@ class Ethnicity:
     @classmethod
     def ethnic_background_ids_with_display_names(cls):
         """
-        Returns a list of tuples containing the id and display name for each ethnic background.
+        Returns a tuple of tuples containing the id and display name for each ethnic background.
         """
-        choices = []
-        for ethnic_backgrounds in cls.DATA.values():
-            for background in ethnic_backgrounds:
-                choices.append((background["id"], background["display_name"]))
-        return tuple(choices)
+        return ETHNIC_BACKGROUND_CHOICES
 
     @classmethod
     def ethnic_category(cls, ethnic_background_id: str):
         """
         Returns the top-level ethnic category for the given ethnic background id.
         """
-        for category, ethnic_backgrounds in cls.DATA.items():
-            for background in ethnic_backgrounds:
-                if ethnic_background_id == background["id"]:
-                    return category
-        return None
+        return _ETHNIC_CATEGORY_BY_ID.get(ethnic_background_id)
 
     @classmethod
     def ethnic_background_display_name(cls, ethnic_background_id: str):
         """
         Returns the display name for the given ethnic background id.
         """
-        for _, ethnic_backgrounds in cls.DATA.items():
-            for background in ethnic_backgrounds:
-                if ethnic_background_id == background["id"]:
-                    return background["display_name"]
-        return None
+        return _ETHNIC_BACKGROUND_DISPLAY_NAME_BY_ID.get(ethnic_background_id)
+
+    @classmethod
+    def ethnic_category_expression(cls, field="ethnic_background_id"):
+        """
+        Returns a database expression for the top-level ethnic category of the
+        ethnic background id in `field`.
+        """
+        return Case(
+            *[
+                When(
+                    **{
+                        f"{field}__in": [background["id"] for background in backgrounds]
+                    },
+                    then=Value(category),
+                )
+                for category, backgrounds in cls.DATA.items()
+            ],
+            default=Value(None),
+            output_field=models.CharField(),
+        )
+
+    @classmethod
+    def ethnic_background_display_name_expression(cls, field="ethnic_background_id"):
+        """
+        Returns a database expression for the display name of the ethnic
+        background id in `field`.
+        """
+        return Case(
+            *[
+                When(**{field: id}, then=Value(display_name))
+                for id, display_name in ETHNIC_BACKGROUND_CHOICES
+            ],
+            default=Value(None),
+            output_field=models.CharField(),
+        )
+
+
+ETHNIC_BACKGROUND_CHOICES = tuple(
+    (background["id"], background["display_name"])
+    for backgrounds in Ethnicity.DATA.values()
+    for background in backgrounds
+)
+
+_ETHNIC_CATEGORY_BY_ID = MappingProxyType(
+    {
+        background["id"]: category
+        for category, backgrounds in Ethnicity.DATA.items()
+        for background in backgrounds
+    }
+)
+
+_ETHNIC_BACKGROUND_DISPLAY_NAME_BY_ID = MappingProxyType(
+    dict(ETHNIC_BACKGROUND_CHOICES)
+)
+
+
+class Age(models.Func):
+    """
+    Age in whole years on `today` of someone born on `date_of_birth`
+    """
+
+    function = "age"
+    template = "date_part('year', %(function)s(%(expressions)s))::integer"
+    output_field = models.IntegerField()
+
+    def __init__(self, date_of_birth, today=None):
+        super().__init__(
+            Value(today or date.today(), output_field=models.DateField()),
+            date_of_birth,
+        )
+
+
+class ParticipantQuerySet(models.QuerySet):
+    def with_age(self, today=None):
+        """
+        Annotate each participant with their `age_in_years`, calculated by the database
+        """
+        return self.annotate(age_in_years=Age("date_of_birth", today=today))
+
+    def aged_between(self, minimum, maximum, today=None):
+        """
+        Participants aged from `minimum` to `maximum` years old, inclusive.
+        This filters on date of birth, so it can use the index.
+        """
+        today = today or date.today()
+        return self.filter(
+            date_of_birth__gt=today - relativedelta(years=maximum + 1),
+            date_of_birth__lte=today - relativedelta(years=minimum),
+        )
+
+    def with_ethnicity(self):
+        """
+        Annotate each participant with `ethnic_category_name` and
+        `ethnic_background_name`, for lists and reports of many participants.
+        """
+        return self.annotate(
+            ethnic_category_name=Ethnicity.ethnic_category_expression(),
+            ethnic_background_name=Ethnicity.ethnic_background_display_name_expression(),
+        )
 
 
 class Participant(BaseModel):
     PREFER_NOT_TO_SAY = "Prefer not to say"
-    ETHNIC_BACKGROUND_CHOICES = Ethnicity.ethnic_background_ids_with_display_names()
+    ETHNIC_BACKGROUND_CHOICES = ETHNIC_BACKGROUND_CHOICES
+
+    objects = ParticipantQuerySet.as_manager()
 
     first_name = models.TextField()
     last_name = models.TextField()
@@ -112,7 +216,7 @@ class Participant(BaseModel):
     nhs_number = models.TextField()
     phone = models.TextField()
     email = models.EmailField()
-    date_of_birth = models.DateField()
+    date_of_birth = models.DateField(db_index=True)
     ethnic_background_id = models.CharField(
         blank=True, null=True, choices=ETHNIC_BACKGROUND_CHOICES
     )
@@ -151,7 +255,31 @@ class ParticipantAddress(models.Model):
     postcode = models.CharField(blank=True, null=True)
 
 
+class ScreeningEpisodeQuerySet(models.QuerySet):
+    def with_recency(self):
+        """
+        Annotate each episode with its `recency` among its participant's episodes:
+        1 for the most recent, 2 for the one before that, and so on. Episodes
+        created at the same time are told apart by their id, as in `previous`.
+        """
+        return self.annotate(
+            recency=Window(
+                RowNumber(),
+                partition_by=F("participant_id"),
+                order_by=[F("created_at").desc(), F("id").desc()],
+            )
+        )
+
+    def most_recent(self, n):
+        """
+        The `n` most recent episodes of each participant, in a single query
+        """
+        return self.with_recency().filter(recency__lte=n)
+
+
 class ScreeningEpisode(BaseModel):
+    objects = ScreeningEpisodeQuerySet.as_manager()
+
     participant = models.ForeignKey(Participant, on_delete=models.PROTECT)
 
     def screening_history(self):
@@ -170,50 +298,185 @@ class ScreeningEpisode(BaseModel):
 
     def previous(self) -> "ScreeningEpisode | None":
         """
-        Return the last known screening episode
+        Return the last known screening episode before this one, in a single query.
+
+        The participant's episodes are ordered by when they were created, then by
+        id so that the order is stable, and the one followed by this episode is
+        returned.
+        """
+        return (
+            ScreeningEpisode.objects.filter(participant_id=self.participant_id)
+            .annotate(
+                next_episode_id=Window(
+                    Lead("id"),
+                    partition_by=F("participant_id"),
+                    order_by=[F("created_at").asc(), F("id").asc()],
+                )
+            )
+            .filter(next_episode_id=self.pk)
+            .first()
+        )
+
+
+class AppointmentStatus(models.Model):
+    CONFIRMED = "CONFIRMED"
+    CANCELLED = "CANCELLED"
+    DID_NOT_ATTEND = "DID_NOT_ATTEND"
+    CHECKED_IN = "CHECKED_IN"
+    SCREENED = "SCREENED"
+    PARTIALLY_SCREENED = "PARTIALLY_SCREENED"
+    ATTENDED_NOT_SCREENED = "ATTENDED_NOT_SCREENED"
+
+    STATUS_CHOICES = {
+        CONFIRMED: "Confirmed",
+        CANCELLED: "Cancelled",
+        DID_NOT_ATTEND: "Did not attend",
+        CHECKED_IN: "Checked in",
+        SCREENED: "Screened",
+        PARTIALLY_SCREENED: "Partially screened",
+        ATTENDED_NOT_SCREENED: "Attended not screened",
+    }
+    state = models.CharField(choices=STATUS_CHOICES, max_length=50, default=CONFIRMED)
+
+    id = models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    appointment = models.ForeignKey(
+        "Appointment", on_delete=models.PROTECT, related_name="statuses"
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # Covers finding the latest status of an appointment without a sort
+            models.Index(
+                fields=["appointment", "-created_at"],
+                include=["state", "id"],
+                name="appointmentstatus_latest_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Save the status, and if it is a new one, make it the appointment's current state
+        within the same transaction.
         """
-        try:
-            return self.screening_history()[0]
-        except IndexError:
-            return None
+        adding = self._state.adding
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if adding:
+                Appointment.objects.filter(pk=self.appointment_id).update(
+                    current_state=self.state
+                )
+
+        if adding and self._meta.get_field("appointment").is_cached(self):
+            self.appointment.current_state = self.state
+
+
+@dataclass(slots=True, frozen=True)
+class ParticipantSummary:
+    """
+    The participant details shown in lists of appointments
+    """
+
+    id: uuid.UUID
+    first_name: str
+    last_name: str
+    nhs_number: str
+    date_of_birth: date
+    # Calculated by the database, as in `ParticipantQuerySet.with_age`
+    age_in_years: int
+
+    # This only depends on the fields above, so works the same as on the model
+    full_name = Participant.full_name
+
+    @property
+    def pk(self):
+        return self.id
+
+    def age(self):
+        return self.age_in_years
+
+
+@dataclass(slots=True, frozen=True)
+class ClinicSlotSummary:
+    id: uuid.UUID
+    clinic_id: uuid.UUID
+    starts_at: datetime
+    duration_in_minutes: int
+
+
+@dataclass(slots=True, frozen=True)
+class AppointmentSummary:
+    """
+    A read-only appointment with only the details needed to list it,
+    fetched with `AppointmentQuerySet.summaries`
+    """
+
+    STATE_DISPLAY = dict(AppointmentStatus.STATUS_CHOICES)
+
+    id: uuid.UUID
+    current_state: str | None
+    clinic_slot: ClinicSlotSummary
+    participant: ParticipantSummary
+
+    @property
+    def pk(self):
+        return self.id
+
+    def get_current_state_display(self):
+        return self.STATE_DISPLAY[self.current_state or AppointmentStatus.CONFIRMED]
 
 
 class AppointmentQuerySet(models.QuerySet):
+    REMAINING_STATES = (
+        AppointmentStatus.CONFIRMED,
+        AppointmentStatus.CHECKED_IN,
+    )
+    CHECKED_IN_STATES = (AppointmentStatus.CHECKED_IN,)
+    COMPLETE_STATES = (
+        AppointmentStatus.CANCELLED,
+        AppointmentStatus.DID_NOT_ATTEND,
+        AppointmentStatus.SCREENED,
+        AppointmentStatus.PARTIALLY_SCREENED,
+        AppointmentStatus.ATTENDED_NOT_SCREENED,
+    )
+
     def in_status(self, *statuses):
-        return self.filter(
-            statuses=Subquery(
-                AppointmentStatus.objects.filter(
-                    appointment=OuterRef("pk"),
-                    state__in=statuses,
-                )
-                .values("pk")
-                .order_by("-created_at")[:1]
+        return self.filter(current_state__in=statuses)
+
+    def refresh_current_state(self):
+        """
+        Recalculate the denormalised `current_state` column from the most recent
+        `AppointmentStatus` of each appointment, in a single UPDATE statement.
+
+        Returns the number of appointments updated.
+        """
+        return self.update(
+            current_state=Subquery(
+                AppointmentStatus.objects.filter(appointment=OuterRef("pk"))
+                .order_by("-created_at")
+                .values("state")[:1]
             )
         )
 
     def remaining(self):
-        return self.in_status(
-            AppointmentStatus.CONFIRMED,
-            AppointmentStatus.CHECKED_IN,
-        )
+        return self.in_status(*self.REMAINING_STATES)
 
     def checked_in(self):
-        return self.in_status(AppointmentStatus.CHECKED_IN)
+        return self.in_status(*self.CHECKED_IN_STATES)
 
     def complete(self):
-        return self.in_status(
-            AppointmentStatus.CANCELLED,
-            AppointmentStatus.DID_NOT_ATTEND,
-            AppointmentStatus.SCREENED,
-            AppointmentStatus.PARTIALLY_SCREENED,
-            AppointmentStatus.ATTENDED_NOT_SCREENED,
-        )
+        return self.in_status(*self.COMPLETE_STATES)
 
     def upcoming(self):
-        return self.filter(clinic_slot__starts_at__gte=date.today())
+        start, _ = day_range()
+        return self.filter(clinic_slot__starts_at__gte=start)
 
     def past(self):
-        return self.filter(clinic_slot__starts_at__lt=date.today())
+        start, _ = day_range()
+        return self.filter(clinic_slot__starts_at__lt=start)
 
     def for_clinic_and_filter(self, clinic, filter):
         match filter:
@@ -228,11 +491,59 @@ class AppointmentQuerySet(models.QuerySet):
             case _:
                 raise ValueError(filter)
 
+    def with_details(self):
+        """
+        Join the slot, clinic, screening episode, participant and address onto
+        each appointment, so they are fetched in the same query.
+        """
+        return self.select_related(
+            "clinic_slot__clinic",
+            "screening_episode__participant__address",
+        )
+
+    def summaries(self) -> list[AppointmentSummary]:
+        """
+        Fetch only the columns needed to list the appointments, as AppointmentSummary
+        objects rather than model instances. Participants' ages are calculated by
+        the database.
+        """
+        rows = self.annotate(
+            age_in_years=Age("screening_episode__participant__date_of_birth")
+        ).values_list(
+            "id",
+            "current_state",
+            "clinic_slot_id",
+            "clinic_slot__clinic_id",
+            "clinic_slot__starts_at",
+            "clinic_slot__duration_in_minutes",
+            "screening_episode__participant_id",
+            "screening_episode__participant__first_name",
+            "screening_episode__participant__last_name",
+            "screening_episode__participant__nhs_number",
+            "screening_episode__participant__date_of_birth",
+            "age_in_years",
+        )
+
+        return [
+            AppointmentSummary(
+                id=row[0],
+                current_state=row[1],
+                clinic_slot=ClinicSlotSummary(*row[2:6]),
+                participant=ParticipantSummary(*row[6:12]),
+            )
+            for row in rows
+        ]
+
     def filter_counts_for_clinic(self, clinic):
-        counts = {}
-        for filter in ["remaining", "checked_in", "complete", "all"]:
-            counts[filter] = self.for_clinic_and_filter(clinic, filter).count()
-        return counts
+        """
+        Count the appointments in a clinic matching each filter, using a single query.
+        """
+        return self.filter(clinic_slot__clinic=clinic).aggregate(
+            remaining=Count("pk", filter=Q(current_state__in=self.REMAINING_STATES)),
+            checked_in=Count("pk", filter=Q(current_state__in=self.CHECKED_IN_STATES)),
+            complete=Count("pk", filter=Q(current_state__in=self.COMPLETE_STATES)),
+            all=Count("pk"),
+        )
 
 
 class Appointment(BaseModel):
@@ -246,6 +557,48 @@ class Appointment(BaseModel):
     reinvite = models.BooleanField(default=False)
     stopped_reasons = models.JSONField(null=True, blank=True)
 
+    # Denormalised copy of the most recent `AppointmentStatus.state`, kept up to date
+    # by `AppointmentStatus.save` so that appointments can be filtered by status
+    # without a correlated subquery. Null if the appointment has no statuses, so
+    # that it isn't in any status.
+    current_state = models.CharField(
+        choices=AppointmentStatus.STATUS_CHOICES,
+        max_length=50,
+        null=True,
+        editable=False,
+        db_index=True,
+    )
+
+    def save(self, *args, update_fields=None, **kwargs):
+        """
+        Save the appointment without overwriting `current_state`, unless it is
+        listed in `update_fields`.
+
+        `current_state` is written by `AppointmentStatus.save`, so an instance
+        loaded before the latest status was created would otherwise write back
+        the state it was loaded with.
+        """
+        if update_fields is None and not self._state.adding:
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "current_state"
+            ]
+
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+    def get_current_state_display(self):
+        """
+        As with `current_status`, assume an appointment with no statuses is confirmed
+        """
+        return dict(AppointmentStatus.STATUS_CHOICES)[
+            self.current_state or AppointmentStatus.CONFIRMED
+        ]
+
+    @property
+    def participant(self):
+        return self.screening_episode.participant
+
     @property
     def current_status(self) -> "AppointmentStatus":
         """
@@ -264,33 +617,3 @@ class Appointment(BaseModel):
             return status
 
         return statuses[0]
-
-
-class AppointmentStatus(models.Model):
-    CONFIRMED = "CONFIRMED"
-    CANCELLED = "CANCELLED"
-    DID_NOT_ATTEND = "DID_NOT_ATTEND"
-    CHECKED_IN = "CHECKED_IN"
-    SCREENED = "SCREENED"
-    PARTIALLY_SCREENED = "PARTIALLY_SCREENED"
-    ATTENDED_NOT_SCREENED = "ATTENDED_NOT_SCREENED"
-
-    STATUS_CHOICES = {
-        CONFIRMED: "Confirmed",
-        CANCELLED: "Cancelled",
-        DID_NOT_ATTEND: "Did not attend",
-        CHECKED_IN: "Checked in",
-        SCREENED: "Screened",
-        PARTIALLY_SCREENED: "Partially screened",
-        ATTENDED_NOT_SCREENED: "Attended not screened",
-    }
-    state = models.CharField(choices=STATUS_CHOICES, max_length=50, default=CONFIRMED)
-
-    id = models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    appointment = models.ForeignKey(
-        Appointment, on_delete=models.PROTECT, related_name="statuses"
-    )
-
-    class Meta:
-        ordering = ["-created_at"]
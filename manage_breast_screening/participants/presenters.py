@@ -1,9 +1,8 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 from urllib.parse import quote
 
-from django.urls import reverse
-
 from ..core.utils.date_formatting import format_date, format_relative_date
 from ..core.utils.string_formatting import (
     format_age,
@@ -11,6 +10,7 @@ from ..core.utils.string_formatting import (
     format_phone_number,
     sentence_case,
 )
+from ..core.utils.urls import cached_reverse
 from .models import AppointmentStatus
 
 
@@ -35,24 +35,64 @@ def status_colour(status):
 
 
 class ParticipantPresenter:
+    """
+    Present a Participant, or the ParticipantSummary of one.
+
+    Details are only read from the participant when they are used, so that a
+    summary can be presented as long as only the details it has are shown.
+    """
+
     def __init__(self, participant):
         self._participant = participant
 
         self.id = participant.pk
-        self.extra_needs = participant.extra_needs
-        self.ethnic_category = participant.ethnic_category
-        self.full_name = participant.full_name
-        self.gender = participant.gender
-        self.email = participant.email
-        self.phone = format_phone_number(participant.phone)
-        self.nhs_number = format_nhs_number(participant.nhs_number)
-        self.date_of_birth = format_date(participant.date_of_birth)
-        self.age = format_age(participant.age())
-        self.risk_level = sentence_case(participant.risk_level)
-        self.url = reverse("participants:show", kwargs={"id": participant.pk})
+
+    @cached_property
+    def extra_needs(self):
+        return self._participant.extra_needs
+
+    @cached_property
+    def ethnic_category(self):
+        return self._participant.ethnic_category
+
+    @cached_property
+    def full_name(self):
+        return self._participant.full_name
+
+    @cached_property
+    def gender(self):
+        return self._participant.gender
+
+    @cached_property
+    def email(self):
+        return self._participant.email
+
+    @cached_property
+    def phone(self):
+        return format_phone_number(self._participant.phone)
+
+    @cached_property
+    def nhs_number(self):
+        return format_nhs_number(self._participant.nhs_number)
+
+    @cached_property
+    def date_of_birth(self):
+        return format_date(self._participant.date_of_birth)
+
+    @cached_property
+    def age(self):
+        return format_age(self._participant.age())
+
+    @cached_property
+    def risk_level(self):
+        return sentence_case(self._participant.risk_level)
+
+    @cached_property
+    def url(self):
+        return cached_reverse("participants:show", kwargs={"id": self.id})
 
     def ethnicity_url(self, return_url):
-        url = reverse(
+        url = cached_reverse(
             "participants:edit_ethnicity", kwargs={"id": self._participant.pk}
         )
         if return_url:
@@ -128,15 +168,17 @@ class ParticipantAppointmentsPresenter:
             clinic_type=clinic.get_type_display().capitalize(),
             setting_name=sentence_case(setting.name),
             status=self._present_status(appointment),
-            url=reverse("mammograms:start_screening", kwargs={"id": appointment.pk}),
+            url=cached_reverse(
+                "mammograms:start_screening", kwargs={"id": appointment.pk}
+            ),
         )
 
     def _present_status(self, appointment):
-        current_status = appointment.current_status
-        colour = status_colour(current_status.state)
+        state = appointment.current_state or AppointmentStatus.CONFIRMED
+        colour = status_colour(state)
 
         return {
             "classes": f"nhsuk-tag--{colour} app-nowrap" if colour else "app-nowrap",
-            "text": current_status.get_state_display(),
-            "key": current_status.state,
+            "text": appointment.get_current_state_display(),
+            "key": state,
         }
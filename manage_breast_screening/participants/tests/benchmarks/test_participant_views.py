@@ -0,0 +1,14 @@
+from django.urls import reverse
+
+from manage_breast_screening.core.benchmark_setup import BenchmarkTestCase, Budget
+
+
+class TestParticipantViewsBenchmark(BenchmarkTestCase):
+    def test_show(self):
+        self.assertWithinBudget(
+            "participants:show",
+            lambda: self.client.get(
+                reverse("participants:show", kwargs={"id": self.participant.pk})
+            ),
+            Budget(queries=4, seconds=0.25, peak_memory_kb=500),
+        )
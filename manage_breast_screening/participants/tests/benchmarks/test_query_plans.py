@@ -0,0 +1,26 @@
+from manage_breast_screening.core.benchmark_setup import BenchmarkTestCase
+from manage_breast_screening.participants.models import Appointment, AppointmentStatus
+
+
+class TestAppointmentQueryPlans(BenchmarkTestCase):
+    def test_current_status(self):
+        self.assertUsesIndex(
+            self.busy_appointment.statuses.order_by("-created_at").all(),
+            "appointmentstatus_latest_idx",
+            index_only=True,
+        )
+
+    def test_latest_state(self):
+        self.assertUsesIndex(
+            AppointmentStatus.objects.filter(appointment=self.busy_appointment)
+            .order_by("-created_at")
+            .values("state")[:1],
+            "appointmentstatus_latest_idx",
+            index_only=True,
+        )
+
+    def test_in_status(self):
+        self.assertUsesIndex(
+            Appointment.objects.in_status(AppointmentStatus.CHECKED_IN),
+            "participants_appointment_current_state_a4f027e2",
+        )
@@ -1,7 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from datetime import timezone as tz
+from io import StringIO
 
 import pytest
+import time_machine
+from django.core.management import call_command
 from pytest_django.asserts import assertQuerySetEqual
 
 from manage_breast_screening.clinics.tests.factories import (
@@ -45,6 +48,56 @@ class TestParticipant:
             == display_name
         )
 
+    def test_unknown_ethnic_background(self):
+        participant = ParticipantFactory.build(ethnic_background_id=None)
+
+        assert participant.ethnic_category is None
+        assert participant.ethnic_background is None
+
+    @pytest.mark.django_db
+    def test_with_ethnicity(self):
+        for background_id, _ in models.ETHNIC_BACKGROUND_CHOICES:
+            ParticipantFactory.create(ethnic_background_id=background_id)
+        ParticipantFactory.create(ethnic_background_id=None)
+
+        for participant in models.Participant.objects.with_ethnicity():
+            assert participant.ethnic_category_name == participant.ethnic_category
+            assert participant.ethnic_background_name == participant.ethnic_background
+
+
+@pytest.mark.django_db
+class TestParticipantAge:
+    TODAY = date(2025, 3, 1)
+
+    @pytest.fixture
+    def participants(self):
+        return {
+            date_of_birth: ParticipantFactory.create(date_of_birth=date_of_birth)
+            for date_of_birth in [
+                date(1975, 3, 1),
+                date(1975, 3, 2),
+                date(1953, 3, 2),
+                date(1953, 3, 1),
+                date(1960, 2, 29),
+            ]
+        }
+
+    def test_with_age(self, participants):
+        with time_machine.travel(self.TODAY):
+            for participant in models.Participant.objects.with_age(today=self.TODAY):
+                assert participant.age_in_years == participant.age()
+
+    def test_aged_between(self, participants):
+        assertQuerySetEqual(
+            models.Participant.objects.aged_between(50, 71, today=self.TODAY),
+            [
+                participants[date(1975, 3, 1)],
+                participants[date(1953, 3, 2)],
+                participants[date(1960, 2, 29)],
+            ],
+            ordered=False,
+        )
+
 
 @pytest.mark.django_db
 class TestScreeningEvent:
@@ -57,6 +110,56 @@ class TestScreeningEvent:
         next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
         assert next_episode.previous() == episode
 
+    def test_previous_screening_episode_in_one_query(self, django_assert_num_queries):
+        participant = ParticipantFactory.create()
+        first, second, third = [
+            ScreeningEpisodeFactory.create(participant=participant) for _ in range(3)
+        ]
+        ScreeningEpisodeFactory.create()
+
+        with django_assert_num_queries(1):
+            assert third.previous() == second
+        assert first.previous() is None
+
+    def test_episodes_created_at_the_same_time_are_ordered_by_id(self):
+        participant = ParticipantFactory.create()
+        first, second = sorted(
+            ScreeningEpisodeFactory.create_batch(2, participant=participant),
+            key=lambda episode: episode.pk,
+        )
+        models.ScreeningEpisode.objects.filter(participant=participant).update(
+            created_at=first.created_at
+        )
+
+        assert second.previous() == first
+        assert first.previous() is None
+        assert list(
+            models.ScreeningEpisode.objects.filter(participant=participant).most_recent(
+                1
+            )
+        ) == [second]
+
+    def test_most_recent(self):
+        participant = ParticipantFactory.create()
+        episodes = [
+            ScreeningEpisodeFactory.create(participant=participant) for _ in range(3)
+        ]
+        other_episode = ScreeningEpisodeFactory.create()
+
+        assertQuerySetEqual(
+            models.ScreeningEpisode.objects.most_recent(2),
+            [episodes[1], other_episode, episodes[2]],
+            ordered=False,
+        )
+        assert [
+            episode.recency
+            for episode in models.ScreeningEpisode.objects.filter(
+                participant=participant
+            )
+            .with_recency()
+            .order_by("created_at")
+        ] == [3, 2, 1]
+
 
 @pytest.mark.django_db
 class TestAppointment:
@@ -172,7 +275,7 @@ class TestAppointment:
             ordered=False,
         )
 
-    def test_filter_counts_for_clinic(self):
+    def test_filter_counts_for_clinic(self, django_assert_num_queries):
         # Create a clinic and clinic slots
         clinic = ClinicFactory.create()
         clinic_slot1 = ClinicSlotFactory.create(clinic=clinic)
@@ -202,13 +305,34 @@ class TestAppointment:
             clinic_slot=other_slot, current_status=models.AppointmentStatus.CONFIRMED
         )
 
-        counts = models.Appointment.objects.filter_counts_for_clinic(clinic)
+        with django_assert_num_queries(1):
+            counts = models.Appointment.objects.filter_counts_for_clinic(clinic)
 
         assert counts["remaining"] == 3
         assert counts["checked_in"] == 1
         assert counts["complete"] == 2
         assert counts["all"] == 5
 
+    def test_summaries(self, django_assert_num_queries):
+        appointment = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.CHECKED_IN
+        )
+        participant = appointment.screening_episode.participant
+
+        with django_assert_num_queries(1):
+            [summary] = models.Appointment.objects.filter(pk=appointment.pk).summaries()
+
+        assert summary.pk == appointment.pk
+        assert summary.current_state == models.AppointmentStatus.CHECKED_IN
+        assert summary.get_current_state_display() == "Checked in"
+        assert summary.clinic_slot.clinic_id == appointment.clinic_slot.clinic_id
+        assert summary.clinic_slot.starts_at == appointment.clinic_slot.starts_at
+        assert summary.participant.pk == participant.pk
+        assert summary.participant.full_name == participant.full_name
+        assert summary.participant.nhs_number == participant.nhs_number
+        assert summary.participant.age_in_years == participant.age()
+        assert summary.participant.age() == participant.age()
+
 
 @pytest.mark.django_db
 def test_appointment_current_status():
@@ -219,3 +343,92 @@ def test_appointment_current_status():
 
     assert appointment.statuses.first().state == models.AppointmentStatus.CHECKED_IN
     assert appointment.current_status.state == models.AppointmentStatus.CHECKED_IN
+
+
+@pytest.mark.django_db
+class TestAppointmentCurrentState:
+    def test_no_statuses(self):
+        appointment = AppointmentFactory.create()
+
+        assert appointment.current_state is None
+        assert appointment.get_current_state_display() == "Confirmed"
+        assert not models.Appointment.objects.remaining().exists()
+        assert models.Appointment.objects.filter_counts_for_clinic(
+            appointment.clinic_slot.clinic
+        ) == {"remaining": 0, "checked_in": 0, "complete": 0, "all": 1}
+
+    def test_not_overwritten_by_a_stale_instance(self):
+        appointment = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.CONFIRMED
+        )
+        stale = models.Appointment.objects.get(pk=appointment.pk)
+        appointment.statuses.create(state=models.AppointmentStatus.CHECKED_IN)
+
+        stale.reinvite = True
+        stale.save()
+
+        appointment.refresh_from_db()
+        assert appointment.reinvite
+        assert appointment.current_state == models.AppointmentStatus.CHECKED_IN
+
+    def test_saved_when_listed_in_update_fields(self):
+        appointment = AppointmentFactory.create()
+        appointment.current_state = models.AppointmentStatus.CANCELLED
+
+        appointment.save(update_fields=["current_state"])
+
+        appointment.refresh_from_db()
+        assert appointment.current_state == models.AppointmentStatus.CANCELLED
+
+    def test_updated_when_a_status_is_created(self):
+        appointment = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.CONFIRMED
+        )
+        appointment.statuses.create(state=models.AppointmentStatus.CHECKED_IN)
+
+        assert appointment.current_state == models.AppointmentStatus.CHECKED_IN
+        appointment.refresh_from_db()
+        assert appointment.current_state == models.AppointmentStatus.CHECKED_IN
+
+    def test_not_updated_when_an_old_status_is_resaved(self):
+        appointment = AppointmentFactory.create()
+        old_status = appointment.statuses.create(
+            state=models.AppointmentStatus.CHECKED_IN
+        )
+        appointment.statuses.create(state=models.AppointmentStatus.SCREENED)
+
+        old_status.save()
+
+        appointment.refresh_from_db()
+        assert appointment.current_state == models.AppointmentStatus.SCREENED
+
+    def test_refresh_current_state(self):
+        checked_in = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.CHECKED_IN
+        )
+        no_statuses = AppointmentFactory.create()
+        models.Appointment.objects.update(
+            current_state=models.AppointmentStatus.CANCELLED
+        )
+
+        assert models.Appointment.objects.refresh_current_state() == 2
+
+        checked_in.refresh_from_db()
+        no_statuses.refresh_from_db()
+        assert checked_in.current_state == models.AppointmentStatus.CHECKED_IN
+        assert no_statuses.current_state is None
+
+    def test_backfill_command(self):
+        appointment = AppointmentFactory.create(
+            current_status=models.AppointmentStatus.SCREENED
+        )
+        models.Appointment.objects.update(
+            current_state=models.AppointmentStatus.CONFIRMED
+        )
+        stdout = StringIO()
+
+        call_command("backfill_appointment_current_state", stdout=stdout)
+
+        appointment.refresh_from_db()
+        assert appointment.current_state == models.AppointmentStatus.SCREENED
+        assert "Updated current_state for 1 appointments" in stdout.getvalue()
@@ -109,7 +109,10 @@ class TestParticipantAppointmentPresenter:
         appointment.clinic_slot.clinic.get_type_display.return_value = "screening"
         appointment.clinic_slot.clinic.setting.name = "West of London BSS"
         appointment.pk = UUID(pk)
-        appointment.current_status = AppointmentStatus(state=state)
+        appointment.current_state = state
+        appointment.get_current_state_display.return_value = (
+            AppointmentStatus.STATUS_CHOICES[state]
+        )
 
         return appointment
 